@@ -5,30 +5,186 @@ Main bot application with Telegram integration.
 """
 import asyncio
 import logging
-from typing import Optional, Dict, Any
+import multiprocessing
+import re
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Optional, Dict, Any, List, Tuple
 
-from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, InputFile
+import orjson
+try:
+    import uvloop
+except ImportError:  # uvloop does not support Windows
+    uvloop = None
+from telegram import Update, InlineKeyboardButton, InlineKeyboardMarkup, InputFile, Message
+from telegram.error import BadRequest, TelegramError
 from telegram.ext import (
-    Application, CommandHandler, CallbackQueryHandler, 
-    MessageHandler, ContextTypes, filters, JobQueue
+    AIORateLimiter, Application, CommandHandler, CallbackQueryHandler, ContextTypes
 )
 from telegram.constants import ParseMode
+from telegram.request import HTTPXRequest
 
-from config import config
-from game_manager import game_manager
-from rendering import render_angle
+from config import config, setup_logging
+from game_manager import game_manager, escape_markdown, RANK_EMOJI
+from rendering import render_angle_png
 
 logger = logging.getLogger(__name__)
 
+# Reply to /help (MarkdownV2)
+HELP_TEXT = (
+    "🎯 *Gangle \\- Guess the Angle Game*\n\n"
+    "*How to Play:*\n"
+    "1\\. Use `/start_round` in a group to begin a new round\n"
+    "2\\. Click the 'Guess' button on the angle image\n"
+    "3\\. Use the inline number picker to select your angle \\(0\\-359°\\)\n"
+    "4\\. Confirm your guess \\- it stays private until round ends\\!\n"
+    "5\\. Wait for results and see the leaderboard\\!\n\n"
+    "*Commands:*\n"
+    "• `/start_round` \\- Start a new game round\n"
+    "• `/leaderboard` \\- View current rankings\n"
+    "• `/help` \\- Show this help message\n\n"
+    "*Admin Commands:*\n"
+    "• `/forfeit @username` \\- Remove player from round\n"
+    "• `/reset_leaderboard` \\- Reset all scores\n"
+    "• `/end_round` \\- End current round early \\(admin or starter only\\)\n\n"
+    "*Scoring:*\n"
+    "• Perfect guess \\(0° off\\): 100 points\n"
+    "• Points decrease with accuracy\n"
+    "• 180° off or more: 0 points\n\n"
+    "✨ *New\\!* No private messaging required \\- everything happens in the group\\!\n\n"
+    "🎮 *Have fun guessing angles\\!*"
+)
+
+# Leaderboard messages (MarkdownV2): the post-round summary and the /leaderboard reply
+LEADERBOARD_HEADER_SHORT = "🏆 *Leaderboard* \\(Top 10\\)\n\n"
+LEADERBOARD_EMPTY_SHORT = "📊 *Leaderboard*\n\nNo games played yet\\!"
+LEADERBOARD_HEADER_FULL = "🏆 *Gangle Leaderboard*\n\n"
+LEADERBOARD_EMPTY_FULL = (
+    "📊 *Leaderboard is empty\\!*\n\n"
+    "Start playing rounds to see player rankings here\\."
+)
+
+# Admin rosters rarely change, so get_chat_member results are reused for this long
+ADMIN_CACHE_TTL_SECONDS = 300
+ADMIN_CACHE_MAX_ENTRIES = 1024
+
+# Group sizes drift slowly, so get_chat_member_count results are reused for this long
+MEMBER_COUNT_CACHE_TTL_SECONDS = 3600
+MEMBER_COUNT_CACHE_MAX_ENTRIES = 1024
+
+# Number picker sessions left untouched this long are dropped along with their message
+GUESS_STATE_TTL_SECONDS = 900
+GUESS_STATE_SWEEP_INTERVAL_SECONDS = 60
 
-def escape_markdown(text: str) -> str:
-    """Escape special characters for Markdown V2 formatting."""
-    # Characters that need escaping in Markdown V2
-    special_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-    escaped_text = text
-    for char in special_chars:
-        escaped_text = escaped_text.replace(char, '\\' + char)
-    return escaped_text
+# Worker processes drawing angle images; started when the bot starts, not on the first round
+RENDER_WORKERS = 2
+
+# Callback data layouts; chat and user come from the CallbackQuery itself
+_CONFIRM_RE = re.compile(r'confirm_(\d{1,3})')
+
+
+def format_round_results(results: Dict[str, Any], title: str = "🎉 *Round Complete\\!*") -> str:
+    """Build the MarkdownV2 caption for a finished round's reveal image."""
+    parts = [title, "\n\n", f"🎯 *Correct Angle:* {results['angle']}°\n\n"]
+    
+    scores = results['scores']
+    if scores:
+        parts.append("🏆 *Results:*\n")
+        for i, (player, points, accuracy) in enumerate(scores[:5], 1):
+            emoji = RANK_EMOJI[i - 1] if i <= 3 else f"{i}\\."
+            # Show username with @ prefix, fallback to first_name if no username
+            raw_display_name = f"@{player.username}" if player.username else player.first_name
+            display_name = escape_markdown(raw_display_name)
+            parts.append(f"{emoji} {display_name}: {player.guess}° \\({points} pts, ±{accuracy}°\\)\n")
+        
+        if len(scores) > 5:
+            parts.append(f"\n\\.\\.\\. and {len(scores) - 5} more players")
+    else:
+        parts.append("😔 No valid submissions this round\\.")
+    
+    parts.append(f"\n\n👥 *Participation:* {results['players_participated']}/{results['total_players']} players")
+    return "".join(parts)
+
+
+# Guess button under each angle image; the chat comes from the CallbackQuery
+GUESS_MARKUP = InlineKeyboardMarkup([[InlineKeyboardButton("🎯 Guess the Angle", callback_data="guess")]])
+
+
+def _build_picker_markup(step: int, max_digit: int) -> InlineKeyboardMarkup:
+    """Number picker keyboard offering digits 0..max_digit plus a cancel button."""
+    keyboard = []
+    row = []
+    for digit in range(min(max_digit + 1, 10)):
+        callback_data = f"pick{step}_{digit}"
+        row.append(InlineKeyboardButton(str(digit), callback_data=callback_data))
+        if len(row) == 5:  # 5 buttons per row
+            keyboard.append(row)
+            row = []
+    if row:  # Add remaining buttons
+        keyboard.append(row)
+    
+    # Add cancel button
+    keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data="cancel")])
+    
+    return InlineKeyboardMarkup(keyboard)
+
+
+# Highest selectable digit keyed by (step, hundreds, tens) so guesses stay within 0-359
+_MAX_DIGIT: Dict[Tuple[int, Optional[int], Optional[int]], int] = {(0, None, None): 3}
+for _h in range(4):
+    _MAX_DIGIT[(1, _h, None)] = 5 if _h == 3 else 9
+    for _t in range(10):
+        _MAX_DIGIT[(2, _h, _t)] = 5 if _h * 100 + _t * 10 >= 350 else 9
+del _h, _t
+
+# Every picker keyboard the game can show: step 0-2, with digits capped at 3, 5 or 9
+_PICKERS: Dict[Tuple[int, int], InlineKeyboardMarkup] = {
+    (step, max_digit): _build_picker_markup(step, max_digit)
+    for step in range(3)
+    for max_digit in (3, 5, 9)
+}
+
+
+class OrjsonHTTPXRequest(HTTPXRequest):
+    """HTTPXRequest that decodes Bot API responses and updates with orjson."""
+    
+    @staticmethod
+    def parse_json_payload(payload: bytes) -> Dict[str, Any]:
+        try:
+            return orjson.loads(payload)
+        except orjson.JSONDecodeError as exc:
+            raise TelegramError("Invalid server response") from exc
+
+
+class SendPacedRateLimiter(AIORateLimiter):
+    """AIORateLimiter that holds only new messages to the per-group rate.
+    
+    Telegram's per-group limit counts messages sent to the group, so edits, deletes
+    and callback answers are paced by the overall limit alone and never wait behind
+    a round's photo and result sends.
+    """
+    
+    async def process_request(self, callback, args, kwargs, endpoint, data, rate_limit_args):
+        if not endpoint.startswith('send'):
+            # AIORateLimiter only reads chat_id from data: a non-negative one selects
+            # the overall limiter without a group bucket; the request itself is unchanged
+            data = {'chat_id': 0}
+        return await super().process_request(callback, args, kwargs, endpoint, data, rate_limit_args)
+
+
+@dataclass(slots=True)
+class GuessState:
+    """In-progress number picker session for one player."""
+    chat_id: int
+    user_id: int
+    username: str
+    first_name: str
+    digits: List[Optional[int]] = field(default_factory=lambda: [None, None, None])  # [hundreds, tens, units]
+    step: int = 0  # 0=hundreds, 1=tens, 2=units
+    temp_message_id: Optional[int] = None  # Picker message shown in the group
+    last_active: float = field(default_factory=time.monotonic)  # Refreshed on every digit pick
 
 
 class GangleBot:
@@ -36,25 +192,55 @@ class GangleBot:
     
     def __init__(self):
         """Initialize the bot."""
-        # Build application with job queue enabled
         if not config.telegram_bot_token:
             raise ValueError("TELEGRAM_BOT_TOKEN is required")
         
-        # Build application with job queue explicitly enabled
         self.app = (
             Application.builder()
             .token(config.telegram_bot_token)
+            # Handle updates from different groups/players in parallel instead of one at a time
+            .concurrent_updates(True)
+            # HTTP/2 lets concurrent sends share one multiplexed connection to the Bot API
+            .request(OrjsonHTTPXRequest(
+                connection_pool_size=config.connection_pool_size,
+                pool_timeout=10.0,
+                connect_timeout=10.0,
+                read_timeout=30.0,
+                write_timeout=30.0,
+                http_version="2"
+            ))
+            .get_updates_request(OrjsonHTTPXRequest(
+                connection_pool_size=1,
+                pool_timeout=config.polling_timeout
+            ))
+            # Pace outgoing calls under Telegram's flood limits (30/s overall, 20 sends/min per group)
+            # and retry on 429 RetryAfter instead of failing the handler
+            .rate_limiter(SendPacedRateLimiter(overall_max_rate=30, group_max_rate=20, max_retries=3))
+            .post_init(self._post_init)
+            .post_shutdown(self._post_shutdown)
             .build()
         )
         
-        # Check if job queue is available
-        print(f"DEBUG: Job queue available after init: {self.app.job_queue is not None}")
-        
-        self.user_guess_states: Dict[str, Dict[str, Any]] = {}  # "chat_id:user_id" -> guess state
-        self.status_update_jobs: Dict[int, Any] = {}  # chat_id -> job for status updates
-        self.completion_monitor_jobs: Dict[int, Any] = {}  # chat_id -> job for completion monitoring
+        self.user_guess_states: Dict[Tuple[int, int], GuessState] = {}  # (chat_id, user_id) -> guess state
         self.status_message_ids: Dict[int, int] = {}  # chat_id -> status message_id
+        self._last_status_fingerprint: Dict[int, Tuple[int, int, int, str]] = {}  # chat_id -> what the last posted status showed
+        self._disabled_guess_buttons: Dict[int, int] = {}  # chat_id -> angle image message_id whose Guess button is already disabled
         self.monitoring_tasks: Dict[int, asyncio.Task] = {}  # chat_id -> background monitoring tasks
+        self.round_events: Dict[int, asyncio.Event] = {}  # chat_id -> set when a guess/forfeit may move the completion deadline
+        self.status_refresh_tasks: Dict[int, asyncio.Task] = {}  # chat_id -> pending debounced status update
+        self._bg_tasks: set[asyncio.Task] = set()  # Strong refs to fire-and-forget tasks so they aren't GC'd mid-flight
+        # Render in worker processes so drawing and PNG encoding stay off the event loop. Workers are
+        # spawned rather than forked, so they do not inherit the running loop, sockets or logging thread
+        # locks; a spawned worker re-imports the entry script, which is why main.py imports nothing heavy
+        self._render_pool = ProcessPoolExecutor(max_workers=RENDER_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+        self._png_cache: Dict[int, bytes] = {}  # angle -> PNG bytes of the labelled reveal image; question images are always fresh
+        self._admin_cache: OrderedDict[Tuple[int, int], Tuple[bool, float]] = OrderedDict()  # (chat_id, user_id) -> (is_admin, checked_at), least recently used first
+        self._photo_file_ids: Dict[int, str] = {}  # angle -> Telegram file_id of an uploaded reveal image
+        self._chat_locks: Dict[int, asyncio.Lock] = {}  # chat_id -> lock serializing round completion, /end_round and /forfeit
+        self._completing: set[int] = set()  # chat_ids with a completion check in flight, or whose round it already completed
+        self._member_count_cache: OrderedDict[int, Tuple[int, float]] = OrderedDict()  # chat_id -> (member_count, fetched_at), least recently used first
+        self._state_sweeper: Optional[asyncio.Task] = None  # Periodic expiry of abandoned picker sessions
+        self._state_flusher: Optional[asyncio.Task] = None  # Periodic write-out of changed round state
         self._setup_handlers()
     
     def _setup_handlers(self):
@@ -71,23 +257,105 @@ class GangleBot:
         # Callback query handler for inline buttons
         self.app.add_handler(CallbackQueryHandler(self.handle_callback))
         
-        # Message handler for guess submissions
-        self.app.add_handler(MessageHandler(
-            filters.TEXT & ~filters.COMMAND, 
-            self.handle_guess_message
-        ))
+        # Error handler
+        self.app.add_error_handler(self.error_handler)
+    
+    async def _post_init(self, application: Application):
+        """Start long-lived background tasks once the event loop is running."""
+        # Boot the render workers (and load Pillow and the label font) now, so the first
+        # /start_round after a deploy doesn't wait for them
+        for _ in range(RENDER_WORKERS):
+            self._render_pool.submit(render_angle_png, 0, True)
+        self._state_sweeper = asyncio.create_task(self._sweep_guess_states_loop())
+        self._state_flusher = asyncio.create_task(self._flush_round_state_loop())
+    
+    async def _post_shutdown(self, application: Application):
+        """Stop long-lived background tasks and write out pending round state."""
+        if self._state_sweeper:
+            self._state_sweeper.cancel()
+        if self._state_flusher:
+            self._state_flusher.cancel()
+        game_manager.flush_dirty()
+    
+    def _spawn(self, coro) -> asyncio.Task:
+        """Run a coroutine in the background, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._bg_tasks.add(task)
+        task.add_done_callback(self._on_bg_task_done)
+        return task
+    
+    def _on_bg_task_done(self, task: asyncio.Task):
+        """Drop the finished task and log any exception it raised."""
+        self._bg_tasks.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Background task failed: {task.exception()}", exc_info=task.exception())
+    
+    async def _render(self, angle: int, show_label: bool = False) -> bytes:
+        """
+        Render an angle image in the worker pool.
+        
+        Only reveal images are reused: a question image is drawn with a new random
+        orientation every round, so a repeated angle can't be matched to an earlier reveal.
+        """
+        png = self._png_cache.get(angle) if show_label else None
+        if png is None:
+            loop = asyncio.get_running_loop()
+            png = await loop.run_in_executor(self._render_pool, render_angle_png, angle, show_label)
+            if show_label:
+                self._png_cache[angle] = png
+        return png
+    
+    async def _send_angle_photo(self, chat_id: int, angle: int, show_label: bool, **kwargs) -> Message:
+        """Send an angle image, re-sending a reveal image by file_id once Telegram has a copy."""
+        file_id = self._photo_file_ids.get(angle) if show_label else None
+        if file_id:
+            try:
+                return await self.app.bot.send_photo(chat_id=chat_id, photo=file_id, **kwargs)
+            except BadRequest as e:
+                logger.warning(f"Cached file_id for angle {angle} rejected, re-uploading: {e}")
+                self._photo_file_ids.pop(angle, None)
+        
+        image = await self._render(angle, show_label)
+        filename = "reveal.png" if show_label else "angle.png"
+        message = await self.app.bot.send_photo(chat_id=chat_id, photo=InputFile(image, filename=filename), **kwargs)
+        if show_label and message.photo:
+            self._photo_file_ids[angle] = message.photo[-1].file_id
+        return message
     
     async def _is_user_admin(self, context: ContextTypes.DEFAULT_TYPE, chat_id: int, user_id: int) -> bool:
-        """Check if a user is an admin in the chat."""
+        """Check if a user is an admin in the chat, reusing recent answers."""
+        cache_key = (chat_id, user_id)
+        cached = self._admin_cache.get(cache_key)
+        if cached and time.monotonic() - cached[1] < ADMIN_CACHE_TTL_SECONDS:
+            self._admin_cache.move_to_end(cache_key)
+            return cached[0]
+        
         try:
             chat_member = await context.bot.get_chat_member(chat_id, user_id)
-            return chat_member.status in ['administrator', 'creator']
         except Exception as e:
             logger.error(f"Error checking admin status: {e}")
             return False
         
-        # Error handler
-        self.app.add_error_handler(self.error_handler)
+        is_admin = chat_member.status in ['administrator', 'creator']
+        self._admin_cache[cache_key] = (is_admin, time.monotonic())
+        self._admin_cache.move_to_end(cache_key)
+        if len(self._admin_cache) > ADMIN_CACHE_MAX_ENTRIES:
+            self._admin_cache.popitem(last=False)
+        return is_admin
+    
+    async def _get_member_count(self, context: ContextTypes.DEFAULT_TYPE, chat_id: int) -> int:
+        """Get a chat's member count, reusing a recent answer when there is one."""
+        cached = self._member_count_cache.get(chat_id)
+        if cached and time.monotonic() - cached[1] < MEMBER_COUNT_CACHE_TTL_SECONDS:
+            self._member_count_cache.move_to_end(chat_id)
+            return cached[0]
+        
+        member_count = await context.bot.get_chat_member_count(chat_id)
+        self._member_count_cache[chat_id] = (member_count, time.monotonic())
+        self._member_count_cache.move_to_end(chat_id)
+        if len(self._member_count_cache) > MEMBER_COUNT_CACHE_MAX_ENTRIES:
+            self._member_count_cache.popitem(last=False)
+        return member_count
     
     async def start_bot(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /start command."""
@@ -99,17 +367,18 @@ class GangleBot:
         if update.message.chat.type == 'private':
             # Private chat - welcome message
             await update.message.reply_text(
-                f"👋 Hi {user_name}! Welcome to **Gangle - Guess the Angle Game**!\n\n"
-                "🎯 I'm a group game bot. Add me to a group chat and use `/start_round` to begin playing!\n\n"
-                "✨ **New!** No private messaging needed - all interactions happen in the group using inline buttons!\n\n"
-                "📝 Use `/help` to see all available commands.",
-                parse_mode=ParseMode.MARKDOWN
+                f"👋 Hi {escape_markdown(user_name)}\\! Welcome to *Gangle \\- Guess the Angle Game*\\!\n\n"
+                "🎯 I'm a group game bot\\. Add me to a group chat and use `/start_round` to begin playing\\!\n\n"
+                "✨ *New\\!* No private messaging needed \\- all interactions happen in the group using inline buttons\\!\n\n"
+                "📝 Use `/help` to see all available commands\\.",
+                parse_mode=ParseMode.MARKDOWN_V2
             )
         else:
             # Group chat - redirect to start_round
             await update.message.reply_text(
-                "🎯 Use `/start_round` to begin a new angle guessing game!\n\n"
-                "💡 **New!** Everything happens right here in the group - no private messaging required!"
+                "🎯 Use `/start_round` to begin a new angle guessing game\\!\n\n"
+                "💡 *New\\!* Everything happens right here in the group \\- no private messaging required\\!",
+                parse_mode=ParseMode.MARKDOWN_V2
             )
     
     async def start_round(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -134,60 +403,31 @@ class GangleBot:
             return
         
         try:
-            # Send initial message
-            message = await update.message.reply_text(
-                "🎯 **New Gangle Round Starting!**\n\n"
-                "📐 An angle image will be posted below. Click the **Guess** button to submit your guess privately.\n\n"
-                "⏳ Waiting for the angle image...",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            
-            # Create the round
+            # Create the round, anchored to the /start_round command message
             if not update.effective_user:
                 await update.message.reply_text("❌ Unable to identify user. Please try again.")
                 return
             
-            round_obj = game_manager.create_round(chat_id, message.message_id, update.effective_user.id)
-            
-            # Try to get an estimate of chat members (for better round management)
-            try:
-                member_count = await context.bot.get_chat_member_count(chat_id)
-                # Store estimated member count (excluding bots, we'll estimate ~80% are real users)
-                estimated_players = max(2, min(20, int(member_count * 0.8)))
-                game_manager.set_estimated_players(chat_id, estimated_players)
-                logger.info(f"Estimated {estimated_players} potential players for group {chat_id} (total members: {member_count})")
-            except Exception as e:
-                logger.warning(f"Could not get member count for group {chat_id}: {e}")
-                game_manager.set_estimated_players(chat_id, 5)  # Default estimate
-            
-            # Generate and send angle image
-            angle_image = render_angle(round_obj.angle, show_label=False)
+            round_obj = game_manager.create_round(chat_id, update.message.message_id, update.effective_user.id)
+            self._completing.discard(chat_id)
             
-            # Create inline keyboard
-            keyboard = [[InlineKeyboardButton("🎯 Guess the Angle", callback_data=f"guess_{chat_id}")]]
-            reply_markup = InlineKeyboardMarkup(keyboard)
+            # Estimate the player count while the image is rendered and sent
+            self._spawn(self._estimate_players(chat_id, context))
             
-            # Send the image with guess button
-            angle_message = await context.bot.send_photo(
-                chat_id=chat_id,
-                photo=InputFile(angle_image, filename="angle.png"),
-                caption="📐 **Guess the angle!** (0-359 degrees)\n\nClick the button below to submit your guess privately.",
-                reply_markup=reply_markup,
-                parse_mode=ParseMode.MARKDOWN
+            # Generate and send the image with guess button
+            angle_message = await self._send_angle_photo(
+                chat_id,
+                round_obj.angle,
+                show_label=False,
+                caption="🎯 *New Gangle Round\\!*\n\n📐 *Guess the angle\\!* \\(0\\-359 degrees\\)\n\nClick the button below to submit your guess privately\\.",
+                reply_markup=GUESS_MARKUP,
+                parse_mode=ParseMode.MARKDOWN_V2
             )
             
             # Store the angle image message ID for later cleanup
             game_manager.set_angle_image_message_id(chat_id, angle_message.message_id)
             
-            # Update the initial message
-            await message.edit_text(
-                "🎯 **New Gangle Round Active!**\n\n"
-                "📐 The angle image has been posted below. Click **Guess** to participate!\n\n"
-                "👥 **Status:** Waiting for players...",
-                parse_mode=ParseMode.MARKDOWN
-            )
-            
-            # Start completion monitoring (check every 10 seconds)
+            # Start completion monitoring (wakes at the next completion deadline)
             await self._start_completion_monitoring(chat_id)
             
             logger.info(f"Started new round in group {chat_id} with angle {round_obj.angle}°")
@@ -198,6 +438,18 @@ class GangleBot:
                 "❌ Failed to start round. Please try again."
             )
     
+    async def _estimate_players(self, chat_id: int, context: ContextTypes.DEFAULT_TYPE):
+        """Try to get an estimate of chat members (for better round management)."""
+        try:
+            member_count = await self._get_member_count(context, chat_id)
+            # Store estimated member count (excluding bots, we'll estimate ~80% are real users)
+            estimated_players = max(2, min(20, int(member_count * 0.8)))
+            game_manager.set_estimated_players(chat_id, estimated_players)
+            logger.info(f"Estimated {estimated_players} potential players for group {chat_id} (total members: {member_count})")
+        except Exception as e:
+            logger.warning(f"Could not get member count for group {chat_id}: {e}")
+            game_manager.set_estimated_players(chat_id, 5)  # Default estimate
+    
     async def handle_callback(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle inline button callbacks."""
         query = update.callback_query
@@ -206,13 +458,17 @@ class GangleBot:
         
         await query.answer()
         
-        if query.data.startswith("guess_"):
+        if query.data == "guess":
             await self._handle_guess_button(update, context)
-        elif query.data.startswith("pick_"):
-            await self._handle_number_picker(update, context)
+        elif query.data.startswith("pick0_"):
+            await self._pick_hundreds(update, context)
+        elif query.data.startswith("pick1_"):
+            await self._pick_tens(update, context)
+        elif query.data.startswith("pick2_"):
+            await self._pick_units_confirm(update, context)
         elif query.data.startswith("confirm_"):
             await self._handle_guess_confirmation(update, context)
-        elif query.data.startswith("cancel_"):
+        elif query.data == "cancel":
             await self._handle_guess_cancellation(update, context)
         elif query.data == "completed":
             await self._handle_completed_round_button(update, context)
@@ -257,7 +513,7 @@ class GangleBot:
             return
         
         # Check if player already has an active guess session
-        state_key = f"{chat_id}:{user_id}"
+        state_key = (chat_id, user_id)
         if state_key in self.user_guess_states:
             await query.answer(
                 "🎯 You already have an active guess session! Check your previous message or cancel it first.",
@@ -266,29 +522,29 @@ class GangleBot:
             return
         
         # Initialize guess state for this user
-        state_key = f"{chat_id}:{user_id}"
-        self.user_guess_states[state_key] = {
-            'chat_id': chat_id,
-            'user_id': user_id,
-            'username': username,
-            'first_name': first_name,
-            'guess': [None, None, None],  # [hundreds, tens, units]
-            'step': 0  # 0=hundreds, 1=tens, 2=units
-        }
+        state = self.user_guess_states[state_key] = GuessState(
+            chat_id=chat_id,
+            user_id=user_id,
+            username=username,
+            first_name=first_name
+        )
         
         # Show number picker for hundreds digit
-        keyboard = self._create_number_picker_keyboard(state_key, step=0)
+        keyboard = self._create_number_picker_keyboard(state, step=0)
         
         # Send a temporary message for this user's guess selection
         try:
             temp_message = await context.bot.send_message(
                 chat_id=chat_id,
                 text=f"🎯 {first_name}, select your angle guess:\n\nStep 1/3: Choose hundreds digit (0-3)\n⚠️ Only you can interact with these buttons!",
-                reply_markup=keyboard
+                reply_markup=keyboard,
+                disable_notification=True,
+                reply_to_message_id=round_obj.angle_image_message_id,
+                allow_sending_without_reply=True
             )
             
             # Store the temporary message ID for cleanup
-            self.user_guess_states[state_key]['temp_message_id'] = temp_message.message_id
+            state.temp_message_id = temp_message.message_id
             
             await query.answer("🎯 Use the number picker below to select your guess!", show_alert=False)
             
@@ -299,167 +555,162 @@ class GangleBot:
                 show_alert=True
             )
     
-    def _create_number_picker_keyboard(self, state_key: str, step: int, max_digit: Optional[int] = None) -> InlineKeyboardMarkup:
+    async def _sweep_guess_states_loop(self):
+        """Background loop expiring abandoned picker sessions."""
+        while True:
+            await asyncio.sleep(GUESS_STATE_SWEEP_INTERVAL_SECONDS)
+            self._sweep_guess_states()
+    
+    async def _flush_round_state_loop(self):
+        """Background loop writing batched round changes to storage."""
+        while True:
+            await asyncio.sleep(config.active_game_flush_seconds)
+            game_manager.flush_dirty()
+    
+    def _sweep_guess_states(self):
+        """Drop abandoned picker sessions and delete their messages."""
+        cutoff = time.monotonic() - GUESS_STATE_TTL_SECONDS
+        expired = [key for key, state in self.user_guess_states.items() if state.last_active < cutoff]
+        self._drop_guess_states(expired)
+        if expired:
+            logger.info(f"Expired {len(expired)} abandoned guess sessions")
+    
+    def _drop_guess_states(self, keys: List[Tuple[int, int]]):
+        """Drop picker sessions and delete their picker messages in the background."""
+        for key in keys:
+            state = self.user_guess_states.pop(key)
+            if state.temp_message_id:
+                self._spawn(self._delete_message_quietly(state.chat_id, state.temp_message_id))
+    
+    async def _delete_message_quietly(self, chat_id: int, message_id: int):
+        """Delete a message, ignoring failures (already deleted, too old, no rights)."""
+        try:
+            await self.app.bot.delete_message(chat_id=chat_id, message_id=message_id)
+        except Exception as e:
+            logger.debug(f"Could not delete message {message_id} in {chat_id}: {e}")
+    
+    def _create_number_picker_keyboard(self, state: GuessState, step: int, max_digit: Optional[int] = None) -> InlineKeyboardMarkup:
         """Create number picker keyboard for current step."""
-        state = self.user_guess_states[state_key]
-        chat_id, user_id = state_key.split(':')
-        
         if max_digit is None:
-            if step == 0:  # Hundreds digit (0-3)
-                max_digit = 3
-            elif step == 1:  # Tens digit (0-5 if hundreds is 3, else 0-9)
-                max_digit = 5 if state['guess'][0] == 3 else 9
-            else:  # Units digit (0-5 if angle would be > 359, else 0-9)
-                current_value = (state['guess'][0] or 0) * 100 + (state['guess'][1] or 0) * 10
-                max_digit = 5 if current_value >= 350 else 9
-        
-        # Create number buttons
-        keyboard = []
-        row = []
-        for digit in range(min(max_digit + 1, 10)):
-            callback_data = f"pick_{chat_id}_{user_id}_{step}_{digit}"
-            row.append(InlineKeyboardButton(str(digit), callback_data=callback_data))
-            if len(row) == 5:  # 5 buttons per row
-                keyboard.append(row)
-                row = []
-        if row:  # Add remaining buttons
-            keyboard.append(row)
+            hundreds = state.digits[0] if step > 0 else None
+            tens = state.digits[1] if step > 1 else None
+            max_digit = _MAX_DIGIT[(step, hundreds, tens)]
         
-        # Add cancel button
-        keyboard.append([InlineKeyboardButton("❌ Cancel", callback_data=f"cancel_{chat_id}_{user_id}")])
+        return _PICKERS[(step, max_digit)]
+    
+    async def _picker_selection(self, query) -> Optional[Tuple[GuessState, int]]:
+        """Validate a pick{step}_{digit} callback and return the owner's state and digit."""
+        digit_text = query.data[6:]
+        if len(digit_text) != 1 or not digit_text.isdigit():
+            await query.answer("❌ Invalid callback data", show_alert=True)
+            return None
         
-        return InlineKeyboardMarkup(keyboard)
+        state = self.user_guess_states.get((query.message.chat.id, query.from_user.id))
+        if not await self._check_picker_owner(query, state, "🚫 These buttons are for another player!"):
+            return None
+        state.last_active = time.monotonic()
+        return state, int(digit_text)
     
-    async def _handle_number_picker(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle number picker button selection."""
+    async def _show_picker_message(self, context: ContextTypes.DEFAULT_TYPE, query, state: GuessState,
+                                   message: str, keyboard: InlineKeyboardMarkup, failure_text: str):
+        """Replace the picker message with the next step."""
+        try:
+            # The owner check guarantees the click came from this session's picker message
+            await context.bot.edit_message_text(
+                chat_id=query.message.chat.id,
+                message_id=state.temp_message_id,
+                text=message,
+                reply_markup=keyboard
+            )
+            await query.answer()
+        except Exception as e:
+            logger.error(f"Failed to update number picker: {e}")
+            await query.answer(failure_text, show_alert=True)
+    
+    async def _pick_hundreds(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle a hundreds digit selection and offer the tens digits."""
         query = update.callback_query
-        if not query or not query.data or not query.from_user:
+        if not query or not query.data or not query.from_user or not query.message:
             return
-        
-        # Parse callback data: pick_{chat_id}_{user_id}_{step}_{digit}
-        parts = query.data.split('_')
-        if len(parts) < 5:
-            await query.answer("❌ Invalid callback data", show_alert=True)
+        selection = await self._picker_selection(query)
+        if selection is None:
             return
+        state, digit = selection
         
-        chat_id = int(parts[1])
-        user_id = int(parts[2]) 
-        step = int(parts[3])
-        digit = int(parts[4])
-        
-        # Validate that the person clicking the button is the intended user
-        if query.from_user.id != user_id:
-            await query.answer("🚫 These buttons are for another player!", show_alert=True)
+        state.digits[0] = digit
+        state.step = 1
+        max_digit = _MAX_DIGIT[(1, digit, None)]
+        message = f"🎯 Step 2/3: Choose tens digit (0-{max_digit})\n\nYour guess so far: {digit}__"
+        await self._show_picker_message(context, query, state, message, _PICKERS[(1, max_digit)], message)
+    
+    async def _pick_tens(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle a tens digit selection and offer the units digits."""
+        query = update.callback_query
+        if not query or not query.data or not query.from_user or not query.message:
             return
-        
-        state_key = f"{chat_id}:{user_id}"
-        
-        if state_key not in self.user_guess_states:
-            await query.answer("⚠️ Session expired. Please click Guess again.", show_alert=True)
+        selection = await self._picker_selection(query)
+        if selection is None:
             return
+        state, digit = selection
         
-        state = self.user_guess_states[state_key]
-        state['guess'][step] = digit
-        state['step'] = step + 1
-        
-        # Determine next step and update keyboard
-        if step == 0:  # Just selected hundreds, now select tens
-            next_step = 1
-            max_digit = 5 if digit == 3 else 9
-            next_keyboard = self._create_number_picker_keyboard(state_key, next_step, max_digit)
-            message = f"🎯 Step 2/3: Choose tens digit (0-{max_digit})\n\nYour guess so far: {digit}__"
-            
-        elif step == 1:  # Just selected tens, now select units
-            next_step = 2
-            current_value = state['guess'][0] * 100 + digit * 10
-            max_digit = 5 if current_value >= 350 else 9
-            next_keyboard = self._create_number_picker_keyboard(state_key, next_step, max_digit)
-            message = f"🎯 Step 3/3: Choose units digit (0-{max_digit})\n\nYour guess so far: {state['guess'][0]}{digit}_"
-            
-        else:  # Just selected units - show confirmation
-            final_guess = state['guess'][0] * 100 + state['guess'][1] * 10 + digit
-            confirmation_keyboard = InlineKeyboardMarkup([
-                [InlineKeyboardButton("✅ Confirm", callback_data=f"confirm_{chat_id}_{user_id}_{final_guess}")],
-                [InlineKeyboardButton("🔄 Start Over", callback_data=f"guess_{chat_id}")],
-                [InlineKeyboardButton("❌ Cancel", callback_data=f"cancel_{chat_id}_{user_id}")]
-            ])
-            message = f"🎯 Confirm your guess: {final_guess}°\n\nClick ✅ to submit or 🔄 to start over."
-            
-            try:
-                # Get the temporary message ID from state
-                temp_message_id = state.get('temp_message_id')
-                if temp_message_id:
-                    await context.bot.edit_message_text(
-                        chat_id=chat_id,
-                        message_id=temp_message_id,
-                        text=message,
-                        reply_markup=confirmation_keyboard
-                    )
-                else:
-                    # Fallback: send new message
-                    new_message = await context.bot.send_message(
-                        chat_id=chat_id,
-                        text=message,
-                        reply_markup=confirmation_keyboard
-                    )
-                    self.user_guess_states[state_key]['temp_message_id'] = new_message.message_id
-                
-                await query.answer()
-            except Exception as e:
-                logger.error(f"Failed to show confirmation: {e}")
-                await query.answer("🎯 Click confirm to submit your guess!", show_alert=True)
+        state.digits[1] = digit
+        state.step = 2
+        max_digit = _MAX_DIGIT[(2, state.digits[0], digit)]
+        message = f"🎯 Step 3/3: Choose units digit (0-{max_digit})\n\nYour guess so far: {state.digits[0]}{digit}_"
+        await self._show_picker_message(context, query, state, message, _PICKERS[(2, max_digit)], message)
+    
+    async def _pick_units_confirm(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
+        """Handle a units digit selection and ask the player to confirm the guess."""
+        query = update.callback_query
+        if not query or not query.data or not query.from_user or not query.message:
             return
-        
-        # Continue to next digit selection
-        try:
-            # Get the temporary message ID from state
-            temp_message_id = state.get('temp_message_id')
-            if temp_message_id:
-                await context.bot.edit_message_text(
-                    chat_id=chat_id,
-                    message_id=temp_message_id,
-                    text=message,
-                    reply_markup=next_keyboard
-                )
-            else:
-                # Fallback: send new message
-                new_message = await context.bot.send_message(
-                    chat_id=chat_id,
-                    text=message,
-                    reply_markup=next_keyboard
-                )
-                self.user_guess_states[state_key]['temp_message_id'] = new_message.message_id
-            
-            await query.answer()
-        except Exception as e:
-            logger.error(f"Failed to update number picker: {e}")
-            await query.answer(message, show_alert=True)
+        selection = await self._picker_selection(query)
+        if selection is None:
+            return
+        state, digit = selection
+        
+        state.digits[2] = digit
+        state.step = 3
+        final_guess = state.digits[0] * 100 + state.digits[1] * 10 + digit
+        confirmation_keyboard = InlineKeyboardMarkup([
+            [InlineKeyboardButton("✅ Confirm", callback_data=f"confirm_{final_guess}")],
+            [InlineKeyboardButton("🔄 Start Over", callback_data="guess")],
+            [InlineKeyboardButton("❌ Cancel", callback_data="cancel")]
+        ])
+        message = f"🎯 Confirm your guess: {final_guess}°\n\nClick ✅ to submit or 🔄 to start over."
+        await self._show_picker_message(context, query, state, message, confirmation_keyboard,
+                                        "🎯 Click confirm to submit your guess!")
+    
+    @staticmethod
+    async def _check_picker_owner(query, state: Optional[GuessState], wrong_owner_text: str) -> bool:
+        """Whether the click came from the clicking player's live picker; answers the query if not."""
+        if state is None:
+            await query.answer("⚠️ Session expired. Please click Guess again.", show_alert=True)
+            return False
+        if state.temp_message_id != query.message.message_id:
+            await query.answer(wrong_owner_text, show_alert=True)
+            return False
+        return True
     
     async def _handle_guess_confirmation(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle guess confirmation."""
         query = update.callback_query
-        if not query or not query.data or not query.from_user:
+        if not query or not query.data or not query.from_user or not query.message:
             return
         
-        # Parse callback data: confirm_{chat_id}_{user_id}_{guess}
-        parts = query.data.split('_')
-        if len(parts) < 4:
+        # Parse callback data: confirm_{guess}
+        match = _CONFIRM_RE.fullmatch(query.data)
+        if not match:
             await query.answer("❌ Invalid confirmation data", show_alert=True)
             return
         
-        chat_id = int(parts[1])
-        user_id = int(parts[2])
-        guess = int(parts[3])
-        
-        # Validate that the person clicking the button is the intended user
-        if query.from_user.id != user_id:
-            await query.answer("🚫 This confirmation is for another player!", show_alert=True)
-            return
-        
-        state_key = f"{chat_id}:{user_id}"
+        chat_id = query.message.chat.id
+        user_id = query.from_user.id
+        guess = int(match[1])
         
-        if state_key not in self.user_guess_states:
-            await query.answer("⚠️ Session expired.", show_alert=True)
+        state_key = (chat_id, user_id)
+        state = self.user_guess_states.get(state_key)
+        if not await self._check_picker_owner(query, state, "🚫 This confirmation is for another player!"):
             return
         
         # Submit the guess
@@ -468,50 +719,58 @@ class GangleBot:
             await query.answer("❌ Failed to submit guess. Round may have ended.", show_alert=True)
             return
         
-        # Get the temporary message ID before cleaning up state
-        state = self.user_guess_states[state_key]
-        temp_message_id = state.get('temp_message_id')
-        
-        # Clean up state
-        del self.user_guess_states[state_key]
-        
-        # Clean up the temporary message (delete it to maintain privacy)
-        if temp_message_id:
-            try:
-                await context.bot.delete_message(chat_id=chat_id, message_id=temp_message_id)
-            except Exception as e:
-                logger.error(f"Failed to delete temporary message: {e}")
+        # Clean up state, keeping the temporary message ID for deletion
+        self.user_guess_states.pop(state_key, None)
+        temp_message_id = state.temp_message_id
         
         # Send private confirmation (only visible to the user who clicked)
         await query.answer("✅ Guess submitted successfully! Waiting for other players...", show_alert=True)
         
-        # The asyncio monitoring loop will handle status updates and completion checking
-        # No need to manually trigger them here as they run every 10 seconds
+        # Delete the temporary message (to maintain privacy), refresh status and check completion
+        # concurrently in the background so this callback returns immediately
+        if temp_message_id:
+            self._spawn(self._delete_message_quietly(chat_id, temp_message_id))
+        self._spawn(self._after_guess_submitted(chat_id))
+    
+    async def _after_guess_submitted(self, chat_id: int):
+        """Update the round status, or complete the round if the last guess just came in."""
+        self._wake_monitor(chat_id)
+        status = game_manager.get_round_status(chat_id)
+        if status and status['can_complete']:
+            # The results post supersedes a final status message
+            await self._check_round_completion(chat_id)
+            return
+        self._schedule_status_update(chat_id)
+    
+    def _schedule_status_update(self, chat_id: int):
+        """Coalesce status updates for a chat into one edit per debounce window."""
+        if chat_id in self.status_refresh_tasks:
+            return  # An update is already pending and will pick up the latest state
+        self.status_refresh_tasks[chat_id] = self._spawn(self._debounced_status_update(chat_id))
+    
+    async def _debounced_status_update(self, chat_id: int):
+        """Wait for the debounce window, then post the current round status."""
+        try:
+            await asyncio.sleep(config.status_debounce_seconds)
+        finally:
+            self.status_refresh_tasks.pop(chat_id, None)
+        await self._update_round_status(chat_id)
     
     async def _handle_guess_cancellation(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle guess cancellation."""
         query = update.callback_query
-        if not query or not query.data or not query.from_user:
-            return
-        
-        # Parse callback data: cancel_{chat_id}_{user_id}
-        parts = query.data.split('_')
-        if len(parts) < 3:
-            await query.answer("❌ Invalid cancellation data", show_alert=True)
+        if not query or not query.from_user or not query.message:
             return
         
-        chat_id = int(parts[1])
-        user_id = int(parts[2])
+        chat_id = query.message.chat.id
+        user_id = query.from_user.id
+        state_key = (chat_id, user_id)
         
-        # Validate that the person clicking the button is the intended user
-        if query.from_user.id != user_id:
-            await query.answer("🚫 This cancellation is for another player!", show_alert=True)
+        state = self.user_guess_states.get(state_key)
+        if not await self._check_picker_owner(query, state, "🚫 This cancellation is for another player!"):
             return
         
-        state_key = f"{chat_id}:{user_id}"
-        
-        if state_key in self.user_guess_states:
-            del self.user_guess_states[state_key]
+        self.user_guess_states.pop(state_key, None)
         
         try:
             await query.edit_message_text(
@@ -531,17 +790,30 @@ class GangleBot:
         
         await query.answer("✅ This round has already completed! Use /start_round to begin a new round.", show_alert=True)
     
-    async def handle_guess_message(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
-        """Handle text messages (no longer needed for guess submission)."""
-        # This method is kept for backward compatibility but doesn't process guesses anymore
-        # All guess submission now happens via inline buttons
-        pass
+    @staticmethod
+    def _status_fingerprint(status: Dict[str, Any]) -> Tuple[int, int, int, str]:
+        """What a status message shows beyond its seconds: player counts and which timing line.
+        
+        An edit is only sent when this differs from the last posted fingerprint.
+        """
+        if status['can_complete_in'] > 0:
+            phase = 'countdown'
+        elif status['all_submitted']:
+            phase = 'ready'
+        elif status['time_elapsed'] < config.max_wait_time:
+            phase = 'waiting'
+        else:
+            phase = 'overtime'
+        return (status['active_players'], status['players_submitted'], status['players_forfeited'], phase)
     
-    async def _update_round_status(self, chat_id: int, context: ContextTypes.DEFAULT_TYPE):
-        """Update the round status message in the group."""
+    async def _update_round_status(self, chat_id: int):
+        """Edit the round status message in the group, or post it if there is none yet."""
         status = game_manager.get_round_status(chat_id)
         if not status:
             return
+        fingerprint = self._status_fingerprint(status)
+        if self._last_status_fingerprint.get(chat_id) == fingerprint:
+            return
         
         status_text = (
             f"🎯 *Round Status*\n\n"
@@ -560,7 +832,6 @@ class GangleBot:
             status_text += "✨ *Round ready to complete\\!*\n"
         else:
             # Show time remaining until max wait time
-            from config import config
             max_wait_remaining = max(0, config.max_wait_time - status['time_elapsed'])
             if max_wait_remaining > 0:
                 status_text += f"⏰ *Max wait time:* {int(max_wait_remaining)}s remaining\n"
@@ -569,230 +840,167 @@ class GangleBot:
         
         try:
             # Try to update existing status message first
-            if chat_id in self.status_message_ids:
+            status_message_id = self.status_message_ids.get(chat_id)
+            if status_message_id is not None:
                 try:
-                    await context.bot.edit_message_text(
+                    await self.app.bot.edit_message_text(
                         chat_id=chat_id,
-                        message_id=self.status_message_ids[chat_id],
+                        message_id=status_message_id,
                         text=status_text,
                         parse_mode=ParseMode.MARKDOWN_V2
                     )
+                    # Only a posted status counts, so a failed update is retried next time
+                    self._last_status_fingerprint[chat_id] = fingerprint
                     return  # Successfully updated existing message
                 except Exception as edit_error:
                     # Message might be deleted or not found, remove from tracking and send new one
                     logger.warning(f"Failed to edit status message in group {chat_id}: {edit_error}")
-                    del self.status_message_ids[chat_id]
+                    self.status_message_ids.pop(chat_id, None)
             
             # Send new status message if no existing one or edit failed
-            message = await context.bot.send_message(
+            message = await self.app.bot.send_message(
                 chat_id=chat_id,
                 text=status_text,
-                parse_mode=ParseMode.MARKDOWN_V2
+                parse_mode=ParseMode.MARKDOWN_V2,
+                disable_notification=True,
+                reply_to_message_id=status['message_id'],
+                allow_sending_without_reply=True
             )
             
             # Track the new status message
             self.status_message_ids[chat_id] = message.message_id
+            self._last_status_fingerprint[chat_id] = fingerprint
             
         except Exception as e:
             logger.error(f"Failed to update round status in group {chat_id}: {e}")
     
-    async def _check_round_completion(self, chat_id: int, context: ContextTypes.DEFAULT_TYPE) -> bool:
+    async def _check_round_completion(self, chat_id: int) -> bool:
         """Check if round should be completed and handle completion.
         
+        Calls made while another check for the chat is in flight, or after this round
+        was completed here, return False at once instead of queueing on the lock.
+        
         Returns:
             True if round was completed, False otherwise
         """
+        if chat_id in self._completing:
+            return False
+        self._completing.add(chat_id)
+        completed = False
+        try:
+            async with self._chat_locks.setdefault(chat_id, asyncio.Lock()):
+                completed = await self._complete_round_if_ready(chat_id)
+            return completed
+        finally:
+            if not completed:
+                self._completing.discard(chat_id)  # Completed chats stay gated until start_round
+    
+    async def _complete_round_if_ready(self, chat_id: int) -> bool:
+        """Complete the round and announce results if it is ready; caller holds the completion lock."""
         status = game_manager.get_round_status(chat_id)
         if not status:
-            print(f"DEBUG: No status for chat {chat_id}")
+            logger.debug("No status for chat %s", chat_id)
             return False
             
-        print(f"DEBUG: Round status for chat {chat_id}: all_submitted={status['all_submitted']}, can_complete={status['can_complete']}, time_elapsed={status['time_elapsed']}")
+        logger.debug("Round status for chat %s: all_submitted=%s, can_complete=%s, time_elapsed=%s", chat_id, status['all_submitted'], status['can_complete'], status['time_elapsed'])
         
         # Check if round can be completed (either all submitted + min wait time, or max wait time reached)
         if not status['can_complete']:
-            print(f"DEBUG: Round not ready to complete for chat {chat_id}")
+            logger.debug("Round not ready to complete for chat %s", chat_id)
             return False
         
-        print(f"DEBUG: Attempting to complete round for chat {chat_id}")
+        logger.debug("Attempting to complete round for chat %s", chat_id)
         
         # Complete the round
         results = game_manager.complete_round(chat_id)
         if not results:
-            print(f"DEBUG: Failed to complete round for chat {chat_id}")
+            logger.debug("Failed to complete round for chat %s", chat_id)
             return False
 
-        print(f"DEBUG: Round completed successfully for chat {chat_id}, preparing results...")
-        
-        # Create reveal image with the correct angle
-        reveal_image = render_angle(results['angle'], show_label=True)
-        
-        # Prepare results text
-        results_text = "🎉 *Round Complete\\!*\n\n"
-        results_text += f"🎯 *Correct Angle:* {results['angle']}°\n\n"
-        
-        if results['scores']:
-            results_text += "🏆 *Results:*\n"
-            for i, (player, points, accuracy) in enumerate(results['scores'][:5], 1):
-                emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}\\."
-                # Show username with @ prefix, fallback to first_name if no username
-                raw_display_name = f"@{player.username}" if player.username else player.first_name
-                display_name = escape_markdown(raw_display_name)
-                results_text += f"{emoji} {display_name}: {player.guess}° \\({points} pts, ±{accuracy}°\\)\n"
-            
-            if len(results['scores']) > 5:
-                results_text += f"\n\\.\\.\\. and {len(results['scores']) - 5} more players"
-        else:
-            results_text += "😔 No valid submissions this round\\."
+        logger.debug("Round completed successfully for chat %s, preparing results...", chat_id)
         
-        results_text += f"\n\n👥 *Participation:* {results['players_participated']}/{results['total_players']} players"
+        results_text = format_round_results(results)
         
-        # Send reveal image and results
+        # Send reveal image (with the correct angle) and results
         try:
-            print(f"DEBUG: Sending results photo for chat {chat_id}")
-            await context.bot.send_photo(
-                chat_id=chat_id,
-                photo=InputFile(reveal_image, filename="reveal.png"),
+            logger.debug("Sending results photo for chat %s", chat_id)
+            await self._send_angle_photo(
+                chat_id,
+                results['angle'],
+                show_label=True,
                 caption=results_text,
                 parse_mode=ParseMode.MARKDOWN_V2
             )
             
-            print(f"DEBUG: Results sent, sending leaderboard for chat {chat_id}")
-            # Send leaderboard after results
-            await self._send_leaderboard_to_chat(chat_id)
-            
-            # Disable the guess button to prevent further interactions
-            await self._disable_guess_button(chat_id)
+            logger.debug("Results sent, sending leaderboard for chat %s", chat_id)
+            # Send leaderboard after results while disabling the guess button to prevent further interactions
+            await asyncio.gather(
+                self._send_leaderboard_to_chat(chat_id),
+                self._disable_guess_button(chat_id, results['angle_image_message_id'])
+            )
             
             # Stop completion monitoring
             await self._stop_completion_monitoring(chat_id)
             
-            # Cancel any scheduled status updates
-            if hasattr(self, 'status_update_jobs') and chat_id in self.status_update_jobs:
-                self.status_update_jobs[chat_id].schedule_removal()
-                del self.status_update_jobs[chat_id]
-            
             # Clean up status message tracking
-            if chat_id in self.status_message_ids:
-                del self.status_message_ids[chat_id]
+            self.status_message_ids.pop(chat_id, None)
             
             logger.info(f"Round completed in group {chat_id} with {results['players_participated']} participants")
-            print(f"DEBUG: Round completion finished for chat {chat_id}")
             return True
         
         except Exception as e:
             logger.error(f"Failed to send round results in group {chat_id}: {e}")
-            print(f"DEBUG: Error sending results for chat {chat_id}: {e}")
             return False
     
     async def _send_leaderboard_to_chat(self, chat_id: int):
         """Send leaderboard to a specific chat."""
         try:
-            print(f"DEBUG: _send_leaderboard_to_chat called for chat {chat_id}")
-            leaderboard = game_manager.get_leaderboard(chat_id, limit=10)
-            print(f"DEBUG: Leaderboard retrieved: {len(leaderboard) if leaderboard else 0} entries")
+            logger.debug("_send_leaderboard_to_chat called for chat %s", chat_id)
+            rows = game_manager.get_leaderboard_formatted(chat_id, limit=10, style='short')
             
-            if not leaderboard:
+            if not rows:
                 await self.app.bot.send_message(
                     chat_id=chat_id,
-                    text="📊 *Leaderboard*\n\nNo games played yet\\!",
+                    text=LEADERBOARD_EMPTY_SHORT,
                     parse_mode=ParseMode.MARKDOWN_V2
                 )
                 return
-
-            text = "🏆 *Leaderboard* \\(Top 10\\)\n\n"
-            print(f"DEBUG: Processing {len(leaderboard)} leaderboard entries")
-            
-            for i, player in enumerate(leaderboard, 1):
-                print(f"DEBUG: Processing player {i}: keys={list(player.keys())}")
-                emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}\\."
-                # Show username with @ prefix, fallback to first_name if no username
-                raw_display_name = f"@{player['username']}" if player.get('username') else player['first_name']
-                display_name = escape_markdown(raw_display_name)
-                rounds_value = player.get('rounds_played', '?')
-                print(f"DEBUG: Using rounds_played value: {rounds_value}")
-                text += f"{emoji} {display_name}: {player['total_points']} pts \\({rounds_value} rounds\\)\n"
             
-            print(f"DEBUG: Sending leaderboard message")
+            logger.debug("Sending leaderboard message")
             await self.app.bot.send_message(
                 chat_id=chat_id,
-                text=text,
+                text=LEADERBOARD_HEADER_SHORT + rows,
                 parse_mode=ParseMode.MARKDOWN_V2
             )
-            print(f"DEBUG: Leaderboard message sent successfully")
+            logger.debug("Leaderboard message sent successfully")
             
         except Exception as e:
-            print(f"DEBUG: Exception in _send_leaderboard_to_chat: {e}")
-            import traceback
-            traceback.print_exc()
-            raise e
+            logger.debug("Exception in _send_leaderboard_to_chat: %s", e, exc_info=True)
+            raise
     
-    async def _disable_guess_button(self, chat_id: int):
+    async def _disable_guess_button(self, chat_id: int, message_id: Optional[int]):
         """Disable the guess button from the angle image when round completes."""
-        round_obj = game_manager.get_active_round(chat_id)
-        if not round_obj or not round_obj.angle_image_message_id:
-            return
+        if not message_id or self._disabled_guess_buttons.get(chat_id) == message_id:
+            return  # No image, or its button was already replaced
         
         try:
             # Edit the message to remove the inline keyboard
             await self.app.bot.edit_message_reply_markup(
                 chat_id=chat_id,
-                message_id=round_obj.angle_image_message_id,
+                message_id=message_id,
                 reply_markup=InlineKeyboardMarkup([[
                     InlineKeyboardButton("✅ Round Completed", callback_data="completed")
                 ]])
             )
+            self._disabled_guess_buttons[chat_id] = message_id
             logger.info(f"Disabled guess button for completed round in group {chat_id}")
         except Exception as e:
             logger.error(f"Failed to disable guess button in group {chat_id}: {e}")
     
-    def _schedule_status_updates(self, chat_id: int, context: ContextTypes.DEFAULT_TYPE):
-        """Schedule periodic status updates every 10 seconds."""
-        try:
-            # Debug logging
-            print(f"DEBUG: _schedule_status_updates called for chat {chat_id}")
-            
-            # Use self.app.job_queue instead of context.job_queue
-            job_queue = self.app.job_queue
-            
-            # Cancel existing job if any
-            if chat_id in self.status_update_jobs:
-                self.status_update_jobs[chat_id].schedule_removal()
-                del self.status_update_jobs[chat_id]
-            
-            # Schedule new job if job_queue is available
-            if job_queue:
-                job = job_queue.run_repeating(
-                    callback=self._periodic_status_update_callback,
-                    interval=10.0,  # 10 seconds
-                    first=10.0,  # Start after 10 seconds
-                    name=f"status_update_{chat_id}",
-                    data=chat_id  # Pass chat_id as data
-                )
-                self.status_update_jobs[chat_id] = job
-                print(f"DEBUG: Scheduled periodic updates for chat {chat_id}")
-            else:
-                print(f"DEBUG: No job queue available, periodic updates disabled for chat {chat_id}")
-        except Exception as e:
-            print(f"DEBUG: Error scheduling status updates for chat {chat_id}: {e}")
-            logger.error(f"Error scheduling status updates for chat {chat_id}: {e}")
-    
-    async def _periodic_status_update_callback(self, context: ContextTypes.DEFAULT_TYPE):
-        """Job queue callback for periodic status updates."""
-        if context.job and context.job.data and isinstance(context.job.data, int):
-            chat_id = context.job.data
-            await self._periodic_status_update(chat_id, context)
-    
-    async def _periodic_status_update(self, chat_id: int, context: ContextTypes.DEFAULT_TYPE):
-        """Periodic status update callback - deprecated, now handled by asyncio."""
-        # This method is deprecated - status updates are now handled by the asyncio monitoring loop
-        print(f"DEBUG: Deprecated periodic status update called for chat {chat_id} - skipping")
-        pass
-    
     async def _start_completion_monitoring(self, chat_id: int):
         """Start periodic monitoring for round completion using asyncio."""
         try:
-            print(f"DEBUG: _start_completion_monitoring called for chat {chat_id}")
+            logger.debug("_start_completion_monitoring called for chat %s", chat_id)
             
             # Cancel any existing monitoring for this chat
             await self._stop_completion_monitoring(chat_id)
@@ -801,198 +1009,64 @@ class GangleBot:
             task = asyncio.create_task(self._monitor_completion_loop(chat_id))
             self.monitoring_tasks[chat_id] = task
             
-            print(f"DEBUG: Started asyncio completion monitoring for chat {chat_id}")
             logger.info(f"Started asyncio completion monitoring for chat {chat_id}")
         except Exception as e:
-            print(f"DEBUG: Error starting completion monitoring for chat {chat_id}: {e}")
             logger.error(f"Error starting completion monitoring for chat {chat_id}: {e}")
     
     async def _monitor_completion_loop(self, chat_id: int):
-        """Background loop to monitor round completion and send status updates."""
+        """Background task that completes the round at its next deadline.
+        
+        Sleeps until the round can next become completable (min wait with everyone
+        submitted, or max wait), waking early when a guess or forfeit changes that.
+        """
+        wakeup = self.round_events.setdefault(chat_id, asyncio.Event())
         try:
             while True:
-                await asyncio.sleep(10)  # Check every 10 seconds
+                wakeup.clear()
                 
                 # Check if we should still be monitoring this chat
                 if chat_id not in self.monitoring_tasks:
                     break
-                    
-                # Check for round completion
-                round_obj = game_manager.get_active_round(chat_id)
-                if round_obj:
-                    # Send status update first
-                    await self._send_status_update(chat_id)
-                    
-                    # Then check for completion
-                    await self._check_completion_status(chat_id)
-                else:
+                
+                status = game_manager.get_round_status(chat_id)
+                if not status:
                     # No active round, stop monitoring
                     break
+                
+                if status['can_complete']:
+                    timeout = 0
+                elif status['all_submitted']:
+                    timeout = status['can_complete_in']
+                else:
+                    timeout = config.max_wait_time - status['time_elapsed']
+                
+                try:
+                    await asyncio.wait_for(wakeup.wait(), timeout=max(timeout, 1.0))
+                    continue  # Round changed; the guess path already refreshed status, just re-plan
+                except asyncio.TimeoutError:
+                    pass
+                
+                # Deadline reached: send status update first
+                await self._update_round_status(chat_id)
+                
+                # Then complete the round if it is due, through the same gate as guesses and forfeits
+                await self._check_round_completion(chat_id)
                     
         except asyncio.CancelledError:
-            print(f"DEBUG: Completion monitoring cancelled for chat {chat_id}")
+            logger.debug("Completion monitoring cancelled for chat %s", chat_id)
         except Exception as e:
-            print(f"DEBUG: Error in completion monitoring loop for chat {chat_id}: {e}")
             logger.error(f"Error in completion monitoring loop for chat {chat_id}: {e}")
         finally:
-            # Clean up task reference
-            if chat_id in self.monitoring_tasks:
+            # Clean up task reference (unless a newer round's monitor already replaced it)
+            if self.monitoring_tasks.get(chat_id) is asyncio.current_task():
                 del self.monitoring_tasks[chat_id]
+                self.round_events.pop(chat_id, None)
     
-    async def _send_status_update(self, chat_id: int):
-        """Send/update the round status message."""
-        try:
-            status = game_manager.get_round_status(chat_id)
-            if not status:
-                return
-            
-            status_text = (
-                f"🎯 *Round Status*\n\n"
-                f"👥 *Active Players:* {status['active_players']}\n"
-                f"✅ *Submitted:* {status['players_submitted']}\n"
-                f"⏳ *Pending:* {status['players_pending']}\n"
-            )
-            
-            if status['players_forfeited'] > 0:
-                status_text += f"❌ *Forfeited:* {status['players_forfeited']}\n"
-            
-            # Add timing information
-            if status['can_complete_in'] > 0:
-                status_text += f"⏰ *Time until auto\\-complete:* {int(status['can_complete_in'])}s remaining\n"
-            elif status['all_submitted']:
-                status_text += "✨ *Round ready to complete\\!*\n"
-            else:
-                from config import config
-                max_wait_remaining = max(0, config.max_wait_time - status['time_elapsed'])
-                if max_wait_remaining > 0:
-                    status_text += f"⏰ *Max wait time:* {int(max_wait_remaining)}s remaining\n"
-                else:
-                    status_text += f"⏰ *Time elapsed:* {int(status['time_elapsed'])}s\n"
-            
-            # Try to update existing status message first
-            if chat_id in self.status_message_ids:
-                try:
-                    await self.app.bot.edit_message_text(
-                        chat_id=chat_id,
-                        message_id=self.status_message_ids[chat_id],
-                        text=status_text,
-                        parse_mode=ParseMode.MARKDOWN_V2
-                    )
-                    return  # Successfully updated existing message
-                except Exception as edit_error:
-                    # Message might be deleted or not found, remove from tracking and send new one
-                    logger.warning(f"Failed to edit status message in group {chat_id}: {edit_error}")
-                    del self.status_message_ids[chat_id]
-            
-            # Send new status message if no existing one or edit failed
-            message = await self.app.bot.send_message(
-                chat_id=chat_id,
-                text=status_text,
-                parse_mode=ParseMode.MARKDOWN_V2
-            )
-            
-            # Track the new status message
-            self.status_message_ids[chat_id] = message.message_id
-            
-        except Exception as e:
-            logger.error(f"Failed to send status update in group {chat_id}: {e}")
-            print(f"DEBUG: Error sending status update for chat {chat_id}: {e}")
-    
-    async def _check_completion_status(self, chat_id: int):
-        """Check if round should be completed and handle completion if needed."""
-        try:
-            # Use existing round status logic
-            status = game_manager.get_round_status(chat_id)
-            if not status:
-                print(f"DEBUG: No status for chat {chat_id}")
-                return
-                
-            print(f"DEBUG: Round status for chat {chat_id}: all_submitted={status['all_submitted']}, can_complete={status['can_complete']}, time_elapsed={status['time_elapsed']}")
-            
-            # Check if round can be completed
-            if status['can_complete']:
-                print(f"DEBUG: Round ready to complete for chat {chat_id}, calling direct completion")
-                
-                # Complete the round directly
-                results = game_manager.complete_round(chat_id)
-                if not results:
-                    print(f"DEBUG: Failed to complete round for chat {chat_id}")
-                    return
-
-                print(f"DEBUG: Round completed successfully for chat {chat_id}, preparing results...")
-                
-                # Send results using the bot
-                await self._send_round_results(chat_id, results)
-                
-                # Stop monitoring since round is complete
-                await self._stop_completion_monitoring(chat_id)
-                
-        except Exception as e:
-            print(f"DEBUG: Error checking completion status for chat {chat_id}: {e}")
-            logger.error(f"Error checking completion status for chat {chat_id}: {e}")
-    
-    async def _send_round_results(self, chat_id: int, results: dict):
-        """Send the round results to the chat."""
-        try:
-            # Create reveal image with the correct angle
-            reveal_image = render_angle(results['angle'], show_label=True)
-            
-            # Prepare results text
-            results_text = "🎉 *Round Complete\\!*\n\n"
-            results_text += f"🎯 *Correct Angle:* {results['angle']}°\n\n"
-            
-            if results['scores']:
-                results_text += "🏆 *Results:*\n"
-                for i, (player, points, accuracy) in enumerate(results['scores'][:5], 1):
-                    emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}\\."
-                    # Show username with @ prefix, fallback to first_name if no username
-                    raw_display_name = f"@{player.username}" if player.username else player.first_name
-                    display_name = escape_markdown(raw_display_name)
-                    results_text += f"{emoji} {display_name}: {player.guess}° \\({points} pts, ±{accuracy}°\\)\n"
-                
-                if len(results['scores']) > 5:
-                    results_text += f"\n\\.\\.\\. and {len(results['scores']) - 5} more players"
-            else:
-                results_text += "😔 No valid submissions this round\\."
-            
-            results_text += f"\n\n👥 *Participation:* {results['players_participated']}/{results['total_players']} players"
-            
-            # Send reveal image and results
-            await self.app.bot.send_photo(
-                chat_id=chat_id,
-                photo=InputFile(reveal_image, filename="reveal.png"),
-                caption=results_text,
-                parse_mode=ParseMode.MARKDOWN_V2
-            )
-            
-            # Send leaderboard after results
-            await self._send_leaderboard_to_chat(chat_id)
-            
-            # Disable the guess button to prevent further interactions
-            await self._disable_guess_button(chat_id)
-            
-            # Clean up status message tracking
-            if chat_id in self.status_message_ids:
-                del self.status_message_ids[chat_id]
-            
-            logger.info(f"Round completed in group {chat_id} with {results['players_participated']} participants")
-            print(f"DEBUG: Round completion finished for chat {chat_id}")
-            
-        except Exception as e:
-            logger.error(f"Failed to send round results in group {chat_id}: {e}")
-            print(f"DEBUG: Error sending results for chat {chat_id}: {e}")
-    
-    async def _monitor_round_completion_callback(self, context: ContextTypes.DEFAULT_TYPE):
-        """Job queue callback for round completion monitoring."""
-        if context.job and context.job.data and isinstance(context.job.data, int):
-            chat_id = context.job.data
-            await self._monitor_round_completion(chat_id, context)
-    
-    async def _monitor_round_completion(self, chat_id: int, context: ContextTypes.DEFAULT_TYPE):
-        """Monitor for round completion - deprecated, now handled by asyncio."""
-        # This method is deprecated - monitoring is now handled by the asyncio loop
-        print(f"DEBUG: Deprecated round completion monitoring called for chat {chat_id} - skipping")
-        pass
+    def _wake_monitor(self, chat_id: int):
+        """Tell the chat's completion monitor that the round changed."""
+        event = self.round_events.get(chat_id)
+        if event:
+            event.set()
     
     async def _stop_completion_monitoring(self, chat_id: int):
         """Stop the completion monitoring for a chat."""
@@ -1002,20 +1076,22 @@ class GangleBot:
                 task = self.monitoring_tasks[chat_id]
                 task.cancel()
                 del self.monitoring_tasks[chat_id]
-                print(f"DEBUG: Stopped asyncio completion monitoring for chat {chat_id}")
+                self.round_events.pop(chat_id, None)
+                logger.debug("Stopped asyncio completion monitoring for chat %s", chat_id)
             
-            # Also cancel old job queue monitoring if it exists
-            if hasattr(self, 'completion_monitor_jobs') and chat_id in self.completion_monitor_jobs:
-                self.completion_monitor_jobs[chat_id].schedule_removal()
-                del self.completion_monitor_jobs[chat_id]
-                print(f"DEBUG: Stopped job queue completion monitoring for chat {chat_id}")
+            # Drop any status update still waiting in its debounce window
+            pending_status = self.status_refresh_tasks.pop(chat_id, None)
+            if pending_status:
+                pending_status.cancel()
             
             # Clean up status message tracking when stopping monitoring
-            if chat_id in self.status_message_ids:
-                del self.status_message_ids[chat_id]
-                
+            self.status_message_ids.pop(chat_id, None)
+            self._last_status_fingerprint.pop(chat_id, None)
+            
+            # Pickers still open for the finished round can no longer submit a guess
+            self._drop_guess_states([key for key in self.user_guess_states if key[0] == chat_id])
+            
         except Exception as e:
-            print(f"DEBUG: Error stopping completion monitoring for chat {chat_id}: {e}")
             logger.error(f"Error stopping completion monitoring for chat {chat_id}: {e}")
     
     async def show_leaderboard(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -1032,33 +1108,13 @@ class GangleBot:
             )
             return
         
-        leaderboard = game_manager.get_leaderboard(chat_id, limit=10)
+        rows = game_manager.get_leaderboard_formatted(chat_id, limit=10, style='full')
         
-        if not leaderboard:
-            await update.message.reply_text(
-                "📊 *Leaderboard is empty\\!*\n\n"
-                "Start playing rounds to see player rankings here\\.",
-                parse_mode=ParseMode.MARKDOWN_V2
-            )
+        if not rows:
+            await update.message.reply_text(LEADERBOARD_EMPTY_FULL, parse_mode=ParseMode.MARKDOWN_V2)
             return
         
-        leaderboard_text = "🏆 *Gangle Leaderboard*\n\n"
-        
-        for player in leaderboard:
-            rank_emoji = "🥇" if player['rank'] == 1 else "🥈" if player['rank'] == 2 else "🥉" if player['rank'] == 3 else f"{player['rank']}\\."
-            
-            # Show username with @ prefix, fallback to first_name if no username
-            raw_display_name = f"@{player['username']}" if player.get('username') else player['first_name']
-            display_name = escape_markdown(raw_display_name)
-            
-            leaderboard_text += (
-                f"{rank_emoji} *{display_name}*\n"
-                f"    💯 {player['total_points']} points\n"
-                f"    🎮 {player['rounds_played']} rounds\n"
-                f"    🎯 Best: ±{player['best_guess']}°\n\n"
-            )
-        
-        await update.message.reply_text(leaderboard_text, parse_mode=ParseMode.MARKDOWN_V2)
+        await update.message.reply_text(LEADERBOARD_HEADER_FULL + rows, parse_mode=ParseMode.MARKDOWN_V2)
     
     async def forfeit_player(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /forfeit command (admin only)."""
@@ -1069,21 +1125,16 @@ class GangleBot:
         user_id = update.message.from_user.id
         
         # Check if user is admin
-        try:
-            chat_member = await context.bot.get_chat_member(chat_id, user_id)
-            if chat_member.status not in ['administrator', 'creator']:
-                await update.message.reply_text("🚫 Only group admins can forfeit players.")
-                return
-        except Exception:
-            await update.message.reply_text("❌ Failed to check admin status.")
+        if not await self._is_user_admin(context, chat_id, user_id):
+            await update.message.reply_text("🚫 Only group admins can forfeit players.")
             return
         
         # Parse target user
         if not context.args:
             await update.message.reply_text(
-                "❓ **Usage:** `/forfeit @username`\n\n"
+                "❓ *Usage:* `/forfeit @username`\n\n"
                 "Example: `/forfeit @john`",
-                parse_mode=ParseMode.MARKDOWN
+                parse_mode=ParseMode.MARKDOWN_V2
             )
             return
         
@@ -1095,26 +1146,24 @@ class GangleBot:
             await update.message.reply_text("❌ No active round to forfeit from.")
             return
         
-        target_user_id = None
-        for uid, player in round_obj.players.items():
-            if player.username.lower() == target_username.lower():
-                target_user_id = uid
-                break
+        target_user_id = round_obj.find_player_by_username(target_username)
         
         if target_user_id is None:
             await update.message.reply_text(f"❌ Player @{target_username} not found in current round.")
             return
         
         # Forfeit the player
-        success = game_manager.forfeit_player(chat_id, target_user_id)
+        async with self._chat_locks.setdefault(chat_id, asyncio.Lock()):
+            success = game_manager.forfeit_player(chat_id, target_user_id)
         if success:
             await update.message.reply_text(
-                f"❌ **@{target_username} has been forfeited from the current round.**",
-                parse_mode=ParseMode.MARKDOWN
+                f"❌ *@{escape_markdown(target_username)} has been forfeited from the current round\\.*",
+                parse_mode=ParseMode.MARKDOWN_V2
             )
             
             # Check if round should complete
-            await self._check_round_completion(chat_id, context)
+            self._wake_monitor(chat_id)
+            await self._check_round_completion(chat_id)
         else:
             await update.message.reply_text("❌ Failed to forfeit player.")
     
@@ -1127,22 +1176,17 @@ class GangleBot:
         user_id = update.message.from_user.id
         
         # Check if user is admin
-        try:
-            chat_member = await context.bot.get_chat_member(chat_id, user_id)
-            if chat_member.status not in ['administrator', 'creator']:
-                await update.message.reply_text("🚫 Only group admins can reset the leaderboard.")
-                return
-        except Exception:
-            await update.message.reply_text("❌ Failed to check admin status.")
+        if not await self._is_user_admin(context, chat_id, user_id):
+            await update.message.reply_text("🚫 Only group admins can reset the leaderboard.")
             return
         
         # Reset leaderboard
         success = game_manager.reset_leaderboard(chat_id)
         if success:
             await update.message.reply_text(
-                "🔄 **Leaderboard has been reset!**\n\n"
-                "All player scores have been cleared.",
-                parse_mode=ParseMode.MARKDOWN
+                "🔄 *Leaderboard has been reset\\!*\n\n"
+                "All player scores have been cleared\\.",
+                parse_mode=ParseMode.MARKDOWN_V2
             )
         else:
             await update.message.reply_text("❌ Failed to reset leaderboard.")
@@ -1161,9 +1205,9 @@ class GangleBot:
             await update.message.reply_text("❌ No active round to end.")
             return
         
-        # Check if user is admin or the starter of the round
-        is_admin = await self._is_user_admin(context, chat_id, user_id)
+        # Check if user is the starter of the round or an admin (the starter needs no get_chat_member call)
         is_starter = round_obj.starter_user_id == user_id
+        is_admin = not is_starter and await self._is_user_admin(context, chat_id, user_id)
         
         if not is_admin and not is_starter:
             await update.message.reply_text(
@@ -1171,88 +1215,48 @@ class GangleBot:
             )
             return
         
-        # End the round
-        results = game_manager.end_round(chat_id, user_id, is_admin)
-        if results:
-            # Create reveal image with the correct angle
-            reveal_image = render_angle(results['angle'], show_label=True)
-            
-            # Prepare results text
-            results_text = "⏹️ *Round Ended Early\\!*\n\n"
-            results_text += f"🎯 *Correct Angle:* {results['angle']}°\n\n"
-            
-            if results['scores']:
-                results_text += "🏆 *Results:*\n"
-                for i, (player, points, accuracy) in enumerate(results['scores'][:5], 1):
-                    emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}\\."
-                    # Show username with @ prefix, fallback to first_name if no username
-                    raw_display_name = f"@{player.username}" if player.username else player.first_name
-                    display_name = escape_markdown(raw_display_name)
-                    results_text += f"{emoji} {display_name}: {player.guess}° \\({points} pts, ±{accuracy}°\\)\n"
-                
-                if len(results['scores']) > 5:
-                    results_text += f"\n\\.\\.\\. and {len(results['scores']) - 5} more players"
-            else:
-                results_text += "😔 No valid submissions this round\\."
-            
-            results_text += f"\n\n👥 *Participation:* {results['players_participated']}/{results['total_players']} players"
+        # End the round under the lock; it may have completed while the admin check ran
+        async with self._chat_locks.setdefault(chat_id, asyncio.Lock()):
+            still_active = game_manager.get_active_round(chat_id) is round_obj
+            results = game_manager.end_round(chat_id, user_id, is_admin) if still_active else None
+        
+        if not still_active:
+            await update.message.reply_text("❌ This round has already ended.")
+            return
+        if not results:
+            await update.message.reply_text("❌ Failed to end round.")
+            return
+        
+        results_text = format_round_results(results, title="⏹️ *Round Ended Early\\!*")
+        
+        # Send reveal image (with the correct angle) and results; the lock is released so slow
+        # sends don't hold up /forfeit or completion checks in this chat
+        try:
+            await self._send_angle_photo(
+                chat_id,
+                results['angle'],
+                show_label=True,
+                caption=results_text,
+                parse_mode=ParseMode.MARKDOWN_V2
+            )
             
-            # Send reveal image and results
-            try:
-                await context.bot.send_photo(
-                    chat_id=chat_id,
-                    photo=InputFile(reveal_image, filename="reveal.png"),
-                    caption=results_text,
-                    parse_mode=ParseMode.MARKDOWN_V2
-                )
-                
-                # Disable the guess button to prevent further interactions
-                await self._disable_guess_button(chat_id)
-                
-                # Stop completion monitoring
-                await self._stop_completion_monitoring(chat_id)
-                
-                # Clean up status message tracking
-                if chat_id in self.status_message_ids:
-                    del self.status_message_ids[chat_id]
-                
-                logger.info(f"Round ended early in group {chat_id} by user {user_id}")
+            # Disable the guess button to prevent further interactions
+            await self._disable_guess_button(chat_id, results['angle_image_message_id'])
             
-            except Exception as e:
-                logger.error(f"Failed to send round results in group {chat_id}: {e}")
-        else:
-            await update.message.reply_text("❌ Failed to end round.")
+            logger.info(f"Round ended early in group {chat_id} by user {user_id}")
+        
+        except Exception as e:
+            logger.error(f"Failed to send round results in group {chat_id}: {e}")
+        finally:
+            # The round is over even if the results could not be posted
+            await self._stop_completion_monitoring(chat_id)
     
     async def show_help(self, update: Update, context: ContextTypes.DEFAULT_TYPE):
         """Handle /help command."""
         if not update.message:
             return
         
-        help_text = (
-            "🎯 *Gangle \\- Guess the Angle Game*\n\n"
-            "*How to Play:*\n"
-            "1\\. Use `/start_round` in a group to begin a new round\n"
-            "2\\. Click the 'Guess' button on the angle image\n"
-            "3\\. Use the inline number picker to select your angle \\(0\\-359°\\)\n"
-            "4\\. Confirm your guess \\- it stays private until round ends\\!\n"
-            "5\\. Wait for results and see the leaderboard\\!\n\n"
-            "*Commands:*\n"
-            "• `/start_round` \\- Start a new game round\n"
-            "• `/leaderboard` \\- View current rankings\n"
-            "• `/help` \\- Show this help message\n\n"
-            "*Admin Commands:*\n"
-            "• `/forfeit @username` \\- Remove player from round\n"
-            "• `/reset_leaderboard` \\- Reset all scores\n"
-            "• `/end_round` \\- End current round early \\(admin or starter only\\)\n\n"
-            "*Scoring:*\n"
-            "• Perfect guess \\(0° off\\): 100 points\n"
-            "• Points decrease with accuracy\n"
-            "• 180° off or more: 0 points\n\n"
-            "✨ *New\\!* No private messaging required \\- everything happens in the group\\!\n\n"
-            "🎮 *Have fun guessing angles\\!*"
-        )
-        
-        await update.message.reply_text(help_text, parse_mode=ParseMode.MARKDOWN_V2)
+        await update.message.reply_text(HELP_TEXT, parse_mode=ParseMode.MARKDOWN_V2)
     
     async def error_handler(self, update: Optional[Update], context: ContextTypes.DEFAULT_TYPE):
         """Handle errors."""
@@ -1269,32 +1273,18 @@ class GangleBot:
     def _cleanup_all_jobs(self):
         """Clean up all scheduled jobs."""
         try:
-            # Clean up asyncio monitoring tasks
-            for chat_id, task in list(self.monitoring_tasks.items()):
+            # Cancel asyncio monitoring and pending status tasks, then drop them in one go
+            for task in (*self.monitoring_tasks.values(), *self.status_refresh_tasks.values()):
                 try:
                     task.cancel()
-                    del self.monitoring_tasks[chat_id]
-                except Exception:
-                    pass
-            
-            # Clean up old completion monitoring jobs if they exist
-            for chat_id in list(self.completion_monitor_jobs.keys()):
-                try:
-                    self.completion_monitor_jobs[chat_id].schedule_removal()
-                    del self.completion_monitor_jobs[chat_id]
                 except Exception:
-                    pass
-            
-            # Clean up status update jobs
-            for chat_id, job in list(self.status_update_jobs.items()):
-                try:
-                    job.schedule_removal()
-                    del self.status_update_jobs[chat_id]
-                except Exception as e:
-                    logger.error(f"Error cleaning up status job for {chat_id}: {e}")
+                    pass  # The event loop may already be closed
+            self.monitoring_tasks.clear()
+            self.status_refresh_tasks.clear()
             
             # Clear status message tracking
             self.status_message_ids.clear()
+            self._last_status_fingerprint.clear()
             
             logger.info("All scheduled jobs cleaned up")
         except Exception as e:
@@ -1304,13 +1294,22 @@ class GangleBot:
         """Run the bot."""
         logger.info("Starting Gangle bot...")
         try:
-            self.app.run_polling(drop_pending_updates=True)
+            # Long polling: one getUpdates request stays open instead of many short empty round trips
+            self.app.run_polling(
+                drop_pending_updates=True,
+                poll_interval=0.0,
+                timeout=config.polling_timeout
+            )
         finally:
             self._cleanup_all_jobs()
+            self._render_pool.shutdown(wait=False, cancel_futures=True)
 
 
 def main():
     """Main entry point."""
+    setup_logging(config)
+    if uvloop:
+        uvloop.install()  # libuv-based loop: cheaper callback dispatch and timers than the selector loop
     try:
         bot = GangleBot()
         bot.run()
@@ -4,6 +4,8 @@ Loads settings from environment variables and .env file.
 """
 import os
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from dotenv import load_dotenv
 
@@ -21,6 +23,12 @@ class Config:
         if not self.telegram_bot_token:
             raise ValueError("TELEGRAM_BOT_TOKEN environment variable is required")
         
+        # Long-poll timeout for getUpdates (seconds); Telegram holds the request open until an update arrives
+        self.polling_timeout = int(os.getenv('POLLING_TIMEOUT', '30'))
+        
+        # Connections shared by all other Bot API calls (send_photo, edit_message_text, ...)
+        self.connection_pool_size = int(os.getenv('CONNECTION_POOL_SIZE', '256'))
+        
         # Logging configuration
         self.log_level = os.getenv('LOG_LEVEL', 'INFO').upper()
         
@@ -38,37 +46,70 @@ class Config:
         self.min_wait_time = int(os.getenv('MIN_WAIT_TIME', '30'))  # Minimum wait before round can end
         self.max_wait_time = int(os.getenv('MAX_WAIT_TIME', '120'))  # Maximum wait before round force ends
         
-        # Ensure data directories exist
-        self._ensure_directories()
+        # Guesses arriving within this window are folded into a single status message edit
+        self.status_debounce_seconds = float(os.getenv('STATUS_DEBOUNCE_SECONDS', '2'))
+        
+        # Round changes are written to disk in batches this often; a crash loses at most this window
+        self.active_game_flush_seconds = float(os.getenv('ACTIVE_GAME_FLUSH_SECONDS', '5'))
         
-        # Setup logging
-        self._setup_logging()
+        # Data directories are created on first use, so importing config has no filesystem side effects
+        self._dirs_created = False
     
     def _ensure_directories(self):
         """Create necessary directories if they don't exist."""
+        if self._dirs_created:
+            return
         self.data_dir.mkdir(exist_ok=True)
         self.leaderboards_dir.mkdir(exist_ok=True)
         self.games_dir.mkdir(exist_ok=True)
+        self._dirs_created = True
+    
+    def get_database_file(self) -> Path:
+        """Get the SQLite database path holding leaderboards and active games."""
+        self._ensure_directories()
+        return self.data_dir / 'gangle.db'
+
+
+class _ListenerQueueHandler(QueueHandler):
+    """QueueHandler that drains and stops its listener when logging shuts down.
+    
+    logging.shutdown is the first atexit handler registered (when logging is
+    imported), so it runs last: records logged by later handlers, such as the
+    final round flush, are still written.
+    """
+    
+    def __init__(self, log_queue: queue.SimpleQueue, listener: QueueListener):
+        super().__init__(log_queue)
+        self.listener = listener
+    
+    def close(self):
+        if self.listener._thread is not None:
+            self.listener.stop()
+        super().close()
+
+
+def setup_logging(cfg: Config):
+    """Configure logging for the application; called once by the bot entry point.
     
-    def _setup_logging(self):
-        """Configure logging for the application."""
-        log_format = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        logging.basicConfig(
-            level=getattr(logging, self.log_level),
-            format=log_format,
-            handlers=[
-                logging.StreamHandler(),
-                logging.FileHandler(self.data_dir / 'gangle.log')
-            ]
-        )
+    Records are queued on the calling thread and written to the console and log
+    file by a listener thread, so disk writes never block the event loop.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return  # Already configured (same rule as logging.basicConfig)
     
-    def get_leaderboard_file(self, group_id: int) -> Path:
-        """Get the leaderboard file path for a specific group."""
-        return self.leaderboards_dir / f"group_{group_id}.json"
+    cfg._ensure_directories()
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    stream_handler = logging.StreamHandler()
+    stream_handler.setFormatter(formatter)
+    file_handler = logging.FileHandler(cfg.data_dir / 'gangle.log')
+    file_handler.setFormatter(formatter)
     
-    def get_game_file(self, group_id: int) -> Path:
-        """Get the active game file path for a specific group."""
-        return self.games_dir / f"game_{group_id}.json"
+    log_queue = queue.SimpleQueue()
+    root.setLevel(getattr(logging, cfg.log_level))
+    listener = QueueListener(log_queue, stream_handler, file_handler)
+    root.addHandler(_ListenerQueueHandler(log_queue, listener))
+    listener.start()
 
 
 # Global configuration instance
@@ -0,0 +1,35 @@
+"""
+pytest configuration for the Gangle test scripts.
+Each test_*.py file still runs standalone; this lets pytest collect them too.
+"""
+import asyncio
+import inspect
+import os
+import tempfile
+
+import pytest
+
+# Point storage at a throwaway directory before config is imported, so test runs
+# (and each pytest-xdist worker) never touch the real data/gangle.db
+os.environ['DATA_DIR'] = tempfile.mkdtemp(prefix='gangle-test-')
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """Run async test functions in their own event loop, as the scripts do with asyncio.run()."""
+    if inspect.iscoroutinefunction(pyfuncitem.obj):
+        asyncio.run(pyfuncitem.obj())
+        return True
+    return None
+
+
+@pytest.fixture(autouse=True)
+def cleanup_chat():
+    """Drop any round a test left active, so a failed test cannot block the next create_round()."""
+    yield
+    from game_manager import game_manager
+    from storage import storage
+    for chat_id in list(game_manager.active_rounds):
+        game_manager.active_rounds.pop(chat_id, None)
+        game_manager._dirty.discard(chat_id)
+        storage.clear_active_game(chat_id)
@@ -3,13 +3,14 @@
 Debug script to check leaderboard structure
 """
 
-from game_manager import game_manager
-
 # Test chat ID - use the real chat ID from logs
 CHAT_ID = -4900480572
 
 def main():
     """Debug leaderboard structure."""
+    # Imported here so importing this module doesn't load config and storage
+    from game_manager import game_manager
+    
     print("🔍 Checking leaderboard structure...")
     
     leaderboard = game_manager.get_leaderboard(CHAT_ID, limit=10)
@@ -2,17 +2,36 @@
 Game state management for Gangle bot rounds.
 Handles round creation, player management, scoring, and leaderboards.
 """
+import atexit
 import logging
 import random
+import re
+import time
 from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from config import config
 from storage import storage
 
 logger = logging.getLogger(__name__)
 
+# Characters that need escaping in Markdown V2
+_MD2_SPECIAL = '_*[]()~`>#+-=|{}.!'
+_MD2_RE = re.compile(f'[{re.escape(_MD2_SPECIAL)}]')
+_MD2_TABLE = str.maketrans({char: '\\' + char for char in _MD2_SPECIAL})
+
+
+def escape_markdown(text: str) -> str:
+    """Escape special characters for Markdown V2 formatting."""
+    if _MD2_RE.search(text) is None:
+        return text  # Most names need no escaping
+    return text.translate(_MD2_TABLE)
+
+
+# Medals for the top three places in results and leaderboards
+RANK_EMOJI = ("🥇", "🥈", "🥉")
+
 
 @dataclass
 class Player:
@@ -36,6 +55,24 @@ class GameRound:
     angle_image_message_id: Optional[int] = None  # Message ID of the angle image with guess button
     starter_user_id: Optional[int] = None  # User who started this round
     estimated_players: int = 2  # Estimated number of potential players in the group
+    username_index: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)  # lowercased username -> user_id
+    submitted_count: int = field(default=0, repr=False, compare=False)  # Players with a guess
+    forfeited_count: int = field(default=0, repr=False, compare=False)  # Players who forfeited
+    start_monotonic: float = field(default_factory=time.monotonic, repr=False, compare=False)  # start_time on the monotonic clock, for timing
+    
+    def __post_init__(self):
+        """Build the username index and counts for players passed in at construction."""
+        for uid, player in self.players.items():
+            if player.username:
+                self.username_index[player.username.lower()] = uid
+            if player.guess is not None:
+                self.submitted_count += 1
+            if player.is_forfeited:
+                self.forfeited_count += 1
+    
+    def find_player_by_username(self, username: str) -> Optional[int]:
+        """Look up a player's user ID by username (case-insensitive)."""
+        return self.username_index.get(username.lower())
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert round to dictionary for storage."""
@@ -44,8 +81,8 @@ class GameRound:
             'message_id': self.message_id,
             'angle_image_message_id': self.angle_image_message_id,
             'start_time': self.start_time.isoformat(),
-            'players': {str(uid): p.username for uid, p in self.players.items()},
-            'guesses': {str(uid): p.guess for uid, p in self.players.items() if p.guess is not None},
+            'players': {uid: p.username for uid, p in self.players.items()},
+            'guesses': {uid: p.guess for uid, p in self.players.items() if p.guess is not None},
             'forfeited': [uid for uid, p in self.players.items() if p.is_forfeited],
             'status': self.status,
             'starter_user_id': self.starter_user_id,
@@ -62,9 +99,8 @@ class GameRound:
         guesses = data.get('guesses', {})
         forfeited = data.get('forfeited', [])
         
-        for user_id_str, username in player_data.items():
-            user_id = int(user_id_str)
-            guess = guesses.get(user_id_str)
+        for user_id, username in player_data.items():
+            guess = guesses.get(user_id)
             is_forfeited = user_id in forfeited
             
             players[user_id] = Player(
@@ -75,11 +111,14 @@ class GameRound:
                 is_forfeited=is_forfeited
             )
         
+        start_time = datetime.fromisoformat(data['start_time'])
+        
         return cls(
             group_id=group_id,
             angle=data['angle'],
             message_id=data['message_id'],
-            start_time=datetime.fromisoformat(data['start_time']),
+            start_time=start_time,
+            start_monotonic=time.monotonic() - (datetime.utcnow() - start_time).total_seconds(),
             players=players,
             status=data['status'],
             angle_image_message_id=data.get('angle_image_message_id'),
@@ -94,7 +133,11 @@ class GameManager:
     def __init__(self):
         """Initialize the game manager."""
         self.active_rounds: Dict[int, GameRound] = {}
+        self._leaderboard_seq: Dict[int, int] = {}  # group_id -> bumped on every score write or reset
+        self._formatted_leaderboards: Dict[Tuple[int, int, str], Tuple[int, str]] = {}  # (group_id, limit, style) -> (seq, rows)
+        self._dirty: set[int] = set()  # group_ids whose active round changed since the last flush
         self._load_active_rounds()
+        atexit.register(self.flush_dirty)
     
     def _load_active_rounds(self):
         """Load any existing active rounds from storage."""
@@ -102,6 +145,18 @@ class GameManager:
         logger.info("Loading active rounds from storage...")
         # Implementation would scan the games directory and load active rounds
     
+    def _mark_dirty(self, group_id: int):
+        """Queue a group's active round to be written by the next flush_dirty()."""
+        self._dirty.add(group_id)
+    
+    def flush_dirty(self):
+        """Write every active round changed since the last flush to storage."""
+        dirty, self._dirty = self._dirty, set()
+        for group_id in dirty:
+            round_obj = self.active_rounds.get(group_id)
+            if round_obj:
+                storage.save_active_game(group_id, round_obj.to_dict())
+    
     def create_round(self, group_id: int, message_id: int, starter_user_id: Optional[int] = None) -> GameRound:
         """
         Create a new game round.
@@ -158,7 +213,7 @@ class GameManager:
         round_obj = self.get_active_round(group_id)
         if round_obj:
             round_obj.estimated_players = max(2, estimated_count)
-            storage.save_active_game(group_id, round_obj.to_dict())
+            self._mark_dirty(group_id)
             logger.info(f"Set estimated players to {round_obj.estimated_players} for group {group_id}")
     
     def set_angle_image_message_id(self, group_id: int, message_id: int) -> bool:
@@ -177,7 +232,7 @@ class GameManager:
             return False
         
         round_obj.angle_image_message_id = message_id
-        storage.save_active_game(group_id, round_obj.to_dict())
+        self._mark_dirty(group_id)
         logger.info(f"Set angle image message ID to {message_id} for group {group_id}")
         return True
     
@@ -200,8 +255,11 @@ class GameManager:
         
         if user_id in round_obj.players:
             # Update player info in case it changed
-            round_obj.players[user_id].username = username
-            round_obj.players[user_id].first_name = first_name
+            player = round_obj.players[user_id]
+            if player.username and player.username != username:
+                round_obj.username_index.pop(player.username.lower(), None)
+            player.username = username
+            player.first_name = first_name
         else:
             # Add new player
             round_obj.players[user_id] = Player(
@@ -209,8 +267,10 @@ class GameManager:
                 username=username,
                 first_name=first_name
             )
+        if username:
+            round_obj.username_index[username.lower()] = user_id
         
-        storage.save_active_game(group_id, round_obj.to_dict())
+        self._mark_dirty(group_id)
         logger.info(f"Player {username} ({user_id}) added to round in group {group_id}")
         return True
     
@@ -240,8 +300,11 @@ class GameManager:
         if not 0 <= guess <= 359:
             return False
         
-        round_obj.players[user_id].guess = guess
-        storage.save_active_game(group_id, round_obj.to_dict())
+        player = round_obj.players[user_id]
+        if player.guess is None:
+            round_obj.submitted_count += 1
+        player.guess = guess
+        self._mark_dirty(group_id)
         
         logger.info(f"Player {user_id} submitted guess {guess}° in group {group_id}")
         return True
@@ -264,8 +327,11 @@ class GameManager:
         if user_id not in round_obj.players:
             return False
         
-        round_obj.players[user_id].is_forfeited = True
-        storage.save_active_game(group_id, round_obj.to_dict())
+        player = round_obj.players[user_id]
+        if not player.is_forfeited:
+            round_obj.forfeited_count += 1
+        player.is_forfeited = True
+        self._mark_dirty(group_id)
         
         logger.info(f"Player {user_id} forfeited in group {group_id}")
         return True
@@ -282,13 +348,12 @@ class GameManager:
             return None
         
         active_players = len(round_obj.players)  # Players who clicked "Guess"
-        players_submitted = len([p for p in round_obj.players.values() if p.guess is not None])
-        players_forfeited = len([p for p in round_obj.players.values() if p.is_forfeited])
+        players_submitted = round_obj.submitted_count
+        players_forfeited = round_obj.forfeited_count
         players_pending = active_players - players_submitted - players_forfeited
         
         # Calculate time elapsed
-        time_elapsed = datetime.utcnow() - round_obj.start_time
-        time_elapsed_seconds = time_elapsed.total_seconds()
+        time_elapsed_seconds = time.monotonic() - round_obj.start_monotonic
         
         # Smart completion logic:
         # 1. If less than min_wait_time seconds have passed, never end (give people time to join)
@@ -345,12 +410,8 @@ class GameManager:
             diff = abs(player.guess - round_obj.angle)
             accuracy = min(diff, 360 - diff)
             
-            # Calculate points (100 for perfect, scaled down by accuracy)
-            if accuracy == 0:
-                points = config.points_max
-            else:
-                # Linear scaling: 100 points at 0° difference, 0 points at 180° difference
-                points = max(0, int(config.points_max * (1 - accuracy / 180)))
+            # Linear scaling: full points at 0° difference, 0 points at 180° difference
+            points = max(0, int(config.points_max * (1 - accuracy / 180)))
             
             results.append((player, points, accuracy))
         
@@ -388,12 +449,14 @@ class GameManager:
                 guess_accuracy=accuracy
             )
         
-        # Mark round as completed
+        self._bump_leaderboard(group_id)
+        
+        # Mark round as completed; its stored state is deleted below, so it is not re-saved
         round_obj.status = 'completed'
-        storage.save_active_game(group_id, round_obj.to_dict())
         
         # Remove from active rounds and clean up storage
         del self.active_rounds[group_id]
+        self._dirty.discard(group_id)
         storage.clear_active_game(group_id)
         
         # Prepare results
@@ -402,7 +465,8 @@ class GameManager:
             'scores': scores,
             'total_players': len(round_obj.players),
             'players_participated': len(scores),
-            'duration': datetime.utcnow() - round_obj.start_time
+            'duration': datetime.utcnow() - round_obj.start_time,
+            'angle_image_message_id': round_obj.angle_image_message_id
         }
         
         logger.info(f"Round completed for group {group_id}, {len(scores)} players participated")
@@ -443,29 +507,65 @@ class GameManager:
         Returns:
             List of player stats sorted by total points
         """
-        leaderboard = storage.load_leaderboard(group_id)
-        
-        # Convert to list and sort by points
-        players = []
-        for user_id, stats in leaderboard.items():
-            players.append({
-                'user_id': user_id,
-                'rank': 0,  # Will be filled below
-                **stats
-            })
-        
-        # Sort by total points (descending), then by best guess (ascending)
-        players.sort(key=lambda x: (-x['total_points'], x['best_guess']))
+        # Sorted by total points (descending), then by best guess (ascending) in the database
+        players = storage.load_top_players(group_id, limit)
         
         # Assign ranks
-        for i, player in enumerate(players[:limit]):
+        for i, player in enumerate(players):
             player['rank'] = i + 1
         
-        return players[:limit]
+        return players
+    
+    def get_leaderboard_formatted(self, group_id: int, limit: int = 10, style: str = 'short') -> str:
+        """
+        Get the leaderboard rows as MarkdownV2, reusing them until scores change.
+        
+        Args:
+            group_id: The Telegram group ID
+            limit: Maximum number of players to include
+            style: 'short' for one line per player, 'full' for per-player stats
+            
+        Returns:
+            Formatted rows, or an empty string if nobody has played yet
+        """
+        key = (group_id, limit, style)
+        seq = self._leaderboard_seq.get(group_id, 0)
+        cached = self._formatted_leaderboards.get(key)
+        if cached and cached[0] == seq:
+            return cached[1]
+        
+        parts = []
+        for player in self.get_leaderboard(group_id, limit):
+            rank = player['rank']
+            rank_emoji = RANK_EMOJI[rank - 1] if rank <= 3 else f"{rank}\\."
+            # Show username with @ prefix, fallback to first_name if no username
+            raw_display_name = f"@{player['username']}" if player.get('username') else player['first_name']
+            display_name = escape_markdown(raw_display_name)
+            
+            if style == 'short':
+                rounds_value = player.get('rounds_played', '?')
+                parts.append(f"{rank_emoji} {display_name}: {player['total_points']} pts \\({rounds_value} rounds\\)\n")
+            else:
+                parts.append(
+                    f"{rank_emoji} *{display_name}*\n"
+                    f"    💯 {player['total_points']} points\n"
+                    f"    🎮 {player['rounds_played']} rounds\n"
+                    f"    🎯 Best: ±{player['best_guess']}°\n\n"
+                )
+        
+        rows = "".join(parts)
+        self._formatted_leaderboards[key] = (seq, rows)
+        return rows
+    
+    def _bump_leaderboard(self, group_id: int):
+        """Mark a group's formatted leaderboards as stale."""
+        self._leaderboard_seq[group_id] = self._leaderboard_seq.get(group_id, 0) + 1
     
     def reset_leaderboard(self, group_id: int) -> bool:
         """Reset the leaderboard for a group."""
-        return storage.reset_leaderboard(group_id)
+        success = storage.reset_leaderboard(group_id)
+        self._bump_leaderboard(group_id)
+        return success
 
 
 # Global game manager instance
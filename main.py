@@ -0,0 +1,11 @@
+#!/usr/bin/env python3
+"""
+Entry point for the Gangle bot: python main.py
+
+Render workers are spawned processes that re-import the entry script, so the bot
+is imported only under the __main__ guard and workers load nothing but rendering.py.
+"""
+
+if __name__ == "__main__":
+    from bot import main
+    main()
@@ -1,7 +1,27 @@
-import matplotlib.pyplot as plt
-import numpy as np
 import io
+import math
 import random
+from functools import lru_cache
+
+from PIL import Image, ImageDraw, ImageFont
+
+# Output image size in pixels
+IMAGE_SIZE = 400
+# Drawn at this multiple of IMAGE_SIZE and downscaled, for smooth edges
+SUPERSAMPLE = 2
+# Radius of the unit circle in final-image pixels
+UNIT_RADIUS = 180
+
+RAY_COLOR = (0, 0, 0, 255)
+ARC_COLOR = (255, 0, 0, 255)
+CIRCLE_COLOR = (0, 0, 0, 77)  # 30% opaque black
+
+
+@lru_cache(maxsize=1)
+def _label_font() -> ImageFont.ImageFont:
+    """Font for the angle label, loaded once per process."""
+    return ImageFont.load_default(size=17 * SUPERSAMPLE)
+
 
 def render_angle(angle: int, show_label: bool = False) -> bytes:
     """
@@ -12,43 +32,51 @@ def render_angle(angle: int, show_label: bool = False) -> bytes:
     - Optionally shows the angle label (for reveal phase).
     Returns PNG bytes buffer.
     """
-    fig, ax = plt.subplots(figsize=(4, 4))
-    ax.set_aspect('equal')
-    ax.axis('off')
+    size = IMAGE_SIZE * SUPERSAMPLE
+    center = size / 2
+    radius = UNIT_RADIUS * SUPERSAMPLE
+    img = Image.new('RGBA', (size, size), (0, 0, 0, 0))
+    draw = ImageDraw.Draw(img)
 
-    # Circle outline
-    circle = plt.Circle((0, 0), 1, fill=False, linestyle="--", alpha=0.3)
-    ax.add_artist(circle)
+    def point(deg: float, r: float) -> tuple:
+        # Image y grows downwards, so counter-clockwise angles subtract from y
+        rad = math.radians(deg)
+        return (center + r * math.cos(rad), center - r * math.sin(rad))
 
-    # Random base orientation
-    base_angle_deg = random.randint(0, 359)
-    rad1 = np.deg2rad(base_angle_deg)
+    def box(r: float) -> tuple:
+        return (center - r, center - r, center + r, center + r)
 
-    # Second ray = base + angle (unwrapped)
-    rad2 = rad1 + np.deg2rad(angle)
+    # Dashed circle outline: 3° dashes with 2° gaps
+    for start in range(0, 360, 5):
+        draw.arc(box(radius), start, start + 3, fill=CIRCLE_COLOR, width=2 * SUPERSAMPLE)
 
-    # Normalize both to [0, 2π) for plotting rays
-    rad1_mod = rad1 % (2*np.pi)
-    rad2_mod = rad2 % (2*np.pi)
+    # Random base orientation, second ray = base + angle
+    base_angle_deg = random.randint(0, 359)
+    end_angle_deg = base_angle_deg + angle
 
     # Draw rays
-    ax.plot([0, np.cos(rad1_mod)], [0, np.sin(rad1_mod)], color="black", lw=2)
-    ax.plot([0, np.cos(rad2_mod)], [0, np.sin(rad2_mod)], color="black", lw=2)
+    draw.line([point(base_angle_deg, radius), (center, center), point(end_angle_deg, radius)],
+              fill=RAY_COLOR, width=3 * SUPERSAMPLE, joint='curve')
 
-    # Draw arc for true angle (may exceed 2π)
-    theta = np.linspace(rad1, rad2, 400)  # use unwrapped values
-    ax.plot(0.3*np.cos(theta), 0.3*np.sin(theta), color="red", lw=2)
+    # Draw arc for true angle; Pillow sweeps clockwise in image coordinates, so negate
+    if angle:
+        draw.arc(box(0.3 * radius), -end_angle_deg, -base_angle_deg, fill=ARC_COLOR, width=3 * SUPERSAMPLE)
 
     # Optional label at midpoint of arc
     if show_label:
-        mid_angle = (rad1 + rad2) / 2
-        ax.text(0.4*np.cos(mid_angle), 0.4*np.sin(mid_angle),
-                f"{angle}°", ha="center", va="center",
-                color="red", fontsize=12, weight="bold")
+        draw.text(point((base_angle_deg + end_angle_deg) / 2, 0.4 * radius), f"{angle}°",
+                  fill=ARC_COLOR, font=_label_font(), anchor='mm')
 
     # Save as PNG buffer
     buf = io.BytesIO()
-    plt.savefig(buf, format="png", bbox_inches="tight", transparent=True)
-    plt.close(fig)
+    img.reduce(SUPERSAMPLE).save(buf, format='PNG', optimize=False)
     buf.seek(0)
-    return buf
\ No newline at end of file
+    return buf
+
+
+def render_angle_png(angle: int, show_label: bool = False) -> bytes:
+    """
+    PNG bytes for an angle image, as a picklable result for the render pool.
+    Every call picks a new random base orientation, so callers decide what to reuse.
+    """
+    return render_angle(angle, show_label).getvalue()
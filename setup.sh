@@ -7,8 +7,8 @@ echo "🎯 Setting up Gangle - Guess the Angle Bot..."
 python_version=$(python3 -c "import sys; print('.'.join(map(str, sys.version_info[:2])))")
 echo "📍 Python version: $python_version"
 
-if [[ $(echo "$python_version < 3.8" | bc -l) -eq 1 ]]; then
-    echo "❌ Python 3.8 or higher is required"
+if ! python3 -c "import sys; sys.exit(sys.version_info < (3, 10))"; then
+    echo "❌ Python 3.10 or higher is required"
     exit 1
 fi
 
@@ -38,13 +38,13 @@ echo "📁 Ensuring data directories exist..."
 mkdir -p data/leaderboards data/games
 
 # Make bot executable
-chmod +x bot.py
+chmod +x main.py
 
 echo ""
 echo "✅ Setup complete!"
 echo ""
 echo "📋 Next steps:"
 echo "1. Edit .env file and add your Telegram bot token"
-echo "2. Run the bot: python bot.py"
+echo "2. Run the bot: python main.py"
 echo ""
 echo "🎮 Have fun playing Gangle!"
@@ -1,91 +1,154 @@
 """
 Storage layer for persisting game state and leaderboards.
-Uses JSON files for simple, reliable persistence.
+Uses a single SQLite database: one row per leaderboard entry, one row per active game.
 """
 import json
 import logging
-from typing import Dict, Optional, Any
+import sqlite3
+import msgpack
+from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 from config import config
 
 logger = logging.getLogger(__name__)
 
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS leaderboard (
+    group_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    username TEXT,
+    first_name TEXT,
+    total_points INTEGER NOT NULL DEFAULT 0,
+    rounds_played INTEGER NOT NULL DEFAULT 0,
+    best_guess INTEGER NOT NULL DEFAULT 180,
+    last_played TEXT,
+    PRIMARY KEY (group_id, user_id)
+);
+CREATE INDEX IF NOT EXISTS leaderboard_ranking
+    ON leaderboard (group_id, total_points DESC, best_guess ASC);
+CREATE TABLE IF NOT EXISTS leaderboard_backup (
+    reset_at TEXT NOT NULL,
+    group_id INTEGER NOT NULL,
+    user_id INTEGER NOT NULL,
+    username TEXT,
+    first_name TEXT,
+    total_points INTEGER,
+    rounds_played INTEGER,
+    best_guess INTEGER,
+    last_played TEXT
+);
+CREATE TABLE IF NOT EXISTS active_games (
+    group_id INTEGER PRIMARY KEY,
+    state BLOB NOT NULL
+);
+"""
+
+_STATS_COLUMNS = ('username', 'first_name', 'total_points', 'rounds_played', 'best_guess', 'last_played')
+
 
 class StorageManager:
-    """Manages file-based storage for game data."""
+    """Manages SQLite-backed storage for game data."""
     
     def __init__(self):
         """Initialize the storage manager."""
         self.leaderboards_dir = config.leaderboards_dir
         self.games_dir = config.games_dir
+        self._conn: Optional[sqlite3.Connection] = None  # Opened on first use
+    
+    @property
+    def _db(self) -> sqlite3.Connection:
+        """The database connection, created (and seeded from legacy JSON files) on first use."""
+        if self._conn is None:
+            db_file = config.get_database_file()
+            is_new = not db_file.exists()
+            conn = sqlite3.connect(db_file)
+            conn.row_factory = sqlite3.Row
+            # WAL + NORMAL: commits survive a crash of the bot and need no fsync per write
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.executescript(_SCHEMA)
+            self._conn = conn
+            if is_new:
+                self._import_json_files()
+        return self._conn
+    
+    def _import_json_files(self):
+        """Copy leaderboards and active games from the old per-group JSON files into the database."""
+        for file_path in sorted(self.leaderboards_dir.glob('group_*.json')):
+            try:
+                group_id = int(file_path.stem[len('group_'):])
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                self.save_leaderboard(group_id, {int(k): v for k, v in data.items()})
+            except (ValueError, IOError) as e:
+                logger.error(f"Failed to import leaderboard file {file_path.name}: {e}")
+        
+        for file_path in sorted(self.games_dir.glob('game_*.json')):
+            try:
+                group_id = int(file_path.stem[len('game_'):])
+                with open(file_path, 'r', encoding='utf-8') as f:
+                    data = json.load(f)
+                # JSON stringified the user ID keys
+                data['players'] = {int(k): v for k, v in data.get('players', {}).items()}
+                data['guesses'] = {int(k): v for k, v in data.get('guesses', {}).items()}
+                self.save_active_game(group_id, data)
+            except (ValueError, IOError) as e:
+                logger.error(f"Failed to import game file {file_path.name}: {e}")
     
-    def load_leaderboard(self, group_id: int) -> Dict[int, Dict[str, Any]]:
+    def load_top_players(self, group_id: int, limit: int) -> List[Dict[str, Any]]:
         """
-        Load leaderboard data for a group.
+        Load the best players of a group, highest total points first.
+        
+        Ties on points are broken by best guess (closest first).
         
         Args:
             group_id: The Telegram group ID
-            
+            limit: Maximum number of players to return
+        
         Returns:
-            Dictionary mapping user_id to player stats:
-            {
-                user_id: {
-                    'username': str,
-                    'first_name': str,
-                    'total_points': int,
-                    'rounds_played': int,
-                    'best_guess': int (closest guess in degrees),
-                    'last_played': str (ISO timestamp)
-                }
-            }
+            List of player stats dictionaries, each including 'user_id'
         """
-        file_path = config.get_leaderboard_file(group_id)
-        
-        if not file_path.exists():
-            logger.info(f"No leaderboard file found for group {group_id}, returning empty")
-            return {}
-        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Convert string keys back to integers
-            return {int(k): v for k, v in data.items()}
-        
-        except (json.JSONDecodeError, IOError) as e:
+            rows = self._db.execute(
+                "SELECT user_id, username, first_name, total_points, rounds_played, best_guess, last_played "
+                "FROM leaderboard WHERE group_id = ? "
+                "ORDER BY total_points DESC, best_guess ASC LIMIT ?",
+                (group_id, limit)
+            ).fetchall()
+        except sqlite3.Error as e:
             logger.error(f"Failed to load leaderboard for group {group_id}: {e}")
-            return {}
+            return []
+        
+        return [dict(row) for row in rows]
     
     def save_leaderboard(self, group_id: int, leaderboard: Dict[int, Dict[str, Any]]) -> bool:
         """
-        Save leaderboard data for a group.
+        Save leaderboard data for a group, replacing what is stored.
         
         Args:
             group_id: The Telegram group ID
             leaderboard: The leaderboard data to save
-            
+        
         Returns:
             True if saved successfully, False otherwise
         """
-        file_path = config.get_leaderboard_file(group_id)
-        
         try:
-            # Convert integer keys to strings for JSON serialization
-            json_data = {str(k): v for k, v in leaderboard.items()}
-            
-            # Create a backup if file exists
-            if file_path.exists():
-                backup_path = file_path.with_suffix('.json.bak')
-                file_path.rename(backup_path)
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            with self._db:
+                self._db.execute("DELETE FROM leaderboard WHERE group_id = ?", (group_id,))
+                self._db.executemany(
+                    "INSERT INTO leaderboard (group_id, user_id, username, first_name, total_points, "
+                    "rounds_played, best_guess, last_played) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (group_id, user_id, *(stats.get(column) for column in _STATS_COLUMNS))
+                        for user_id, stats in leaderboard.items()
+                    ]
+                )
             
             logger.info(f"Leaderboard saved for group {group_id}")
             return True
         
-        except (IOError, OSError) as e:
+        except sqlite3.Error as e:
             logger.error(f"Failed to save leaderboard for group {group_id}: {e}")
             return False
     
@@ -95,7 +158,7 @@ class StorageManager:
         
         Args:
             group_id: The Telegram group ID
-            
+        
         Returns:
             Game state dictionary or None if no active game:
             {
@@ -108,24 +171,16 @@ class StorageManager:
                 'status': str ('waiting_for_guesses' | 'completed')
             }
         """
-        file_path = config.get_game_file(group_id)
-        
-        if not file_path.exists():
-            return None
-        
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            
-            # Convert string keys back to integers where needed
-            if 'players' in data:
-                data['players'] = {int(k): v for k, v in data['players'].items()}
-            if 'guesses' in data:
-                data['guesses'] = {int(k): v for k, v in data['guesses'].items()}
-            
-            return data
+            row = self._db.execute(
+                "SELECT state FROM active_games WHERE group_id = ?", (group_id,)
+            ).fetchone()
+            if row is None:
+                return None
+            # MessagePack keeps the integer user ID keys as they were saved
+            return msgpack.unpackb(row['state'], raw=False, strict_map_key=False)
         
-        except (json.JSONDecodeError, IOError) as e:
+        except (ValueError, msgpack.UnpackException, sqlite3.Error) as e:
             logger.error(f"Failed to load active game for group {group_id}: {e}")
             return None
     
@@ -136,53 +191,46 @@ class StorageManager:
         Args:
             group_id: The Telegram group ID
             game_state: The game state to save
-            
+        
         Returns:
             True if saved successfully, False otherwise
         """
-        file_path = config.get_game_file(group_id)
-        
         try:
-            # Convert integer keys to strings for JSON serialization
-            json_data = game_state.copy()
-            if 'players' in json_data:
-                json_data['players'] = {str(k): v for k, v in json_data['players'].items()}
-            if 'guesses' in json_data:
-                json_data['guesses'] = {str(k): v for k, v in json_data['guesses'].items()}
-            
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(json_data, f, indent=2, ensure_ascii=False)
+            with self._db:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO active_games (group_id, state) VALUES (?, ?)",
+                    (group_id, msgpack.packb(game_state, use_bin_type=True))
+                )
             
             logger.info(f"Game state saved for group {group_id}")
             return True
         
-        except (IOError, OSError) as e:
+        except (TypeError, sqlite3.Error) as e:
             logger.error(f"Failed to save game state for group {group_id}: {e}")
             return False
     
     def clear_active_game(self, group_id: int) -> bool:
         """
-        Remove active game file for a group.
+        Remove active game state for a group.
         
         Args:
             group_id: The Telegram group ID
-            
+        
         Returns:
             True if cleared successfully, False otherwise
         """
-        file_path = config.get_game_file(group_id)
-        
         try:
-            if file_path.exists():
-                file_path.unlink()
+            with self._db:
+                cursor = self._db.execute("DELETE FROM active_games WHERE group_id = ?", (group_id,))
+            if cursor.rowcount:
                 logger.info(f"Active game cleared for group {group_id}")
             return True
         
-        except OSError as e:
+        except sqlite3.Error as e:
             logger.error(f"Failed to clear active game for group {group_id}: {e}")
             return False
     
-    def update_player_stats(self, group_id: int, user_id: int, username: str, 
+    def update_player_stats(self, group_id: int, user_id: int, username: str,
                           first_name: str, points: int, guess_accuracy: int) -> bool:
         """
         Update a player's statistics in the leaderboard.
@@ -194,33 +242,31 @@ class StorageManager:
             first_name: The player's first name
             points: Points earned in the round
             guess_accuracy: How close the guess was (0 = perfect)
-            
+        
         Returns:
             True if updated successfully, False otherwise
         """
-        leaderboard = self.load_leaderboard(group_id)
-        
-        # Initialize player stats if not exists
-        if user_id not in leaderboard:
-            leaderboard[user_id] = {
-                'username': username,
-                'first_name': first_name,
-                'total_points': 0,
-                'rounds_played': 0,
-                'best_guess': 180,  # Start with worst possible accuracy
-                'last_played': None
-            }
-        
-        # Update stats
-        player_stats = leaderboard[user_id]
-        player_stats['username'] = username  # Update in case it changed
-        player_stats['first_name'] = first_name
-        player_stats['total_points'] += points
-        player_stats['rounds_played'] += 1
-        player_stats['best_guess'] = min(player_stats['best_guess'], guess_accuracy)
-        player_stats['last_played'] = datetime.utcnow().isoformat()
+        try:
+            # Insert a first-round row, or add this round onto the existing one
+            with self._db:
+                self._db.execute(
+                    "INSERT INTO leaderboard (group_id, user_id, username, first_name, total_points, "
+                    "rounds_played, best_guess, last_played) VALUES (?, ?, ?, ?, ?, 1, ?, ?) "
+                    "ON CONFLICT (group_id, user_id) DO UPDATE SET "
+                    "username = excluded.username, "
+                    "first_name = excluded.first_name, "
+                    "total_points = total_points + excluded.total_points, "
+                    "rounds_played = rounds_played + 1, "
+                    "best_guess = MIN(best_guess, excluded.best_guess), "
+                    "last_played = excluded.last_played",
+                    (group_id, user_id, username, first_name, points, min(180, guess_accuracy),
+                     datetime.utcnow().isoformat())
+                )
+            return True
         
-        return self.save_leaderboard(group_id, leaderboard)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to update stats for user {user_id} in group {group_id}: {e}")
+            return False
     
     def reset_leaderboard(self, group_id: int) -> bool:
         """
@@ -228,21 +274,23 @@ class StorageManager:
         
         Args:
             group_id: The Telegram group ID
-            
+        
         Returns:
             True if reset successfully, False otherwise
         """
-        file_path = config.get_leaderboard_file(group_id)
-        
         try:
-            if file_path.exists():
-                # Create backup before deleting
-                backup_path = file_path.with_suffix(f'.json.backup_{int(datetime.utcnow().timestamp())}')
-                file_path.rename(backup_path)
-                logger.info(f"Leaderboard reset for group {group_id}, backup saved as {backup_path.name}")
+            # Keep a copy of the old standings before deleting them
+            with self._db:
+                self._db.execute(
+                    "INSERT INTO leaderboard_backup SELECT ?, * FROM leaderboard WHERE group_id = ?",
+                    (datetime.utcnow().isoformat(), group_id)
+                )
+                cursor = self._db.execute("DELETE FROM leaderboard WHERE group_id = ?", (group_id,))
+            if cursor.rowcount:
+                logger.info(f"Leaderboard reset for group {group_id}, {cursor.rowcount} entries moved to leaderboard_backup")
             return True
         
-        except OSError as e:
+        except sqlite3.Error as e:
             logger.error(f"Failed to reset leaderboard for group {group_id}: {e}")
             return False
 
@@ -3,112 +3,102 @@
 Test script to verify that asyncio-based completion monitoring works correctly.
 """
 
-import time
+from config import config
 from game_manager import game_manager
+from testutils import rewind_round
 
 # Test chat and user IDs
-CHAT_ID = -1001234567890  # Test group ID
+CHAT_ID = -1001234567895  # Test group ID
 USER1_ID = 123456789
 USER2_ID = 987654321
 
-def main():
+def test_asyncio_monitoring():
     """Test the asyncio completion monitoring."""
     print("🔍 Testing asyncio completion monitoring...")
     
     # 1. Create a round
     print("\n1️⃣ Creating test round...")
     round_obj = game_manager.create_round(CHAT_ID, 100, USER1_ID)
-    if not round_obj:
-        print("❌ Failed to create round")
-        return
+    assert round_obj, "Failed to create round"
     
     print("✅ Round created: {}°".format(round_obj.angle))
     
-    # 2. Add players to the round 
+    # 2. Add players to the round
     print("\n2️⃣ Adding players...")
-    game_manager.add_player(CHAT_ID, USER1_ID, "testuser1", "Test User 1")
-    game_manager.add_player(CHAT_ID, USER2_ID, "testuser2", "Test User 2")
+    assert game_manager.add_player(CHAT_ID, USER1_ID, "testuser1", "Test User 1")
+    assert game_manager.add_player(CHAT_ID, USER2_ID, "testuser2", "Test User 2")
     print("✅ Added 2 players")
     
     # 3. Check initial status
     print("\n3️⃣ Checking initial status...")
     status = game_manager.get_round_status(CHAT_ID)
-    if status:
-        print("   Status: all_submitted={}, can_complete={}".format(
-            status['all_submitted'], status['can_complete']))
-        print("   Time elapsed: {:.1f}s".format(status['time_elapsed']))
-    else:
-        print("   No status available")
+    assert status, "No status available"
+    print("   Status: all_submitted={}, can_complete={}".format(
+        status['all_submitted'], status['can_complete']))
+    print("   Time elapsed: {:.1f}s".format(status['time_elapsed']))
+    assert not status['all_submitted']
     
     # 4. Submit guess from one player
     print("\n4️⃣ Submitting guess from player 1...")
     success = game_manager.submit_guess(CHAT_ID, USER1_ID, 45)
     print("✅ Player 1 guess submitted: {}".format(success))
+    assert success
     
     # 5. Check status after one guess
     print("\n5️⃣ Checking status after one guess...")
     status = game_manager.get_round_status(CHAT_ID)
-    if status:
-        print("   Status keys: {}".format(list(status.keys())))
-        print("   Status: all_submitted={}, can_complete={}".format(
-            status['all_submitted'], status['can_complete']))
-        print("   Time elapsed: {:.1f}s".format(status['time_elapsed']))
-        print("   Active players: {}".format(status['active_players']))
-        if 'total_players' in status:
-            print("   Total players: {}".format(status['total_players']))
-    else:
-        print("   No status available")
+    assert status, "No status available"
+    print("   Status keys: {}".format(list(status.keys())))
+    print("   Status: all_submitted={}, can_complete={}".format(
+        status['all_submitted'], status['can_complete']))
+    print("   Time elapsed: {:.1f}s".format(status['time_elapsed']))
+    print("   Active players: {}".format(status['active_players']))
+    assert status['active_players'] == 2
+    assert status['players_pending'] == 1
     
-    # 6. Wait for minimum time to pass
+    # 6. Rewind the round start so the minimum wait time has passed
     print("\n6️⃣ Testing timing conditions...")
-    print("   Waiting 31 seconds for minimum wait time...")
-    time.sleep(31)
+    print("   Rewinding round start by {} seconds...".format(config.min_wait_time + 1))
+    rewind_round(round_obj, config.min_wait_time + 1)
     
     status = game_manager.get_round_status(CHAT_ID)
-    if status:
-        print("   Status after wait: all_submitted={}, can_complete={}".format(
-            status['all_submitted'], status['can_complete']))
-        print("   Time elapsed: {:.1f}s".format(status['time_elapsed']))
-    else:
-        print("   No status available")
+    assert status, "No status available"
+    print("   Status after wait: all_submitted={}, can_complete={}".format(
+        status['all_submitted'], status['can_complete']))
+    print("   Time elapsed: {:.1f}s".format(status['time_elapsed']))
+    assert not status['all_submitted']
     
     # 7. Submit second guess to trigger completion
     print("\n7️⃣ Submitting guess from player 2...")
     success = game_manager.submit_guess(CHAT_ID, USER2_ID, 90)
     print("✅ Player 2 guess submitted: {}".format(success))
+    assert success
     
-    # 8. Check final status 
+    # 8. Check final status
     print("\n8️⃣ Checking final status...")
     status = game_manager.get_round_status(CHAT_ID)
-    if status:
-        print("   Status: all_submitted={}, can_complete={}".format(
-            status['all_submitted'], status['can_complete']))
-        print("   Time elapsed: {:.1f}s".format(status['time_elapsed']))
-        
-        if status['can_complete']:
-            print("✅ Round is ready for completion!")
-            
-            # Test completion
-            print("\n9️⃣ Testing round completion...")
-            results = game_manager.complete_round(CHAT_ID)
-            if results:
-                print("✅ Round completed successfully!")
-                print("   Correct angle: {}°".format(results['angle']))
-                print("   Participants: {}/{}".format(
-                    results['players_participated'], results['total_players']))
-                print("   Winners: {} players scored".format(len(results['scores'])))
-                if results['scores']:
-                    winner = results['scores'][0][0]
-                    print("   Winner: {} with guess {}°".format(
-                        winner.first_name, winner.guess))
-            else:
-                print("❌ Failed to complete round")
-        else:
-            print("⏳ Round not yet ready for completion")
-    else:
-        print("   No status available")
+    assert status, "No status available"
+    print("   Status: all_submitted={}, can_complete={}".format(
+        status['all_submitted'], status['can_complete']))
+    print("   Time elapsed: {:.1f}s".format(status['time_elapsed']))
+    assert status['can_complete'], "Round not ready for completion"
+    print("✅ Round is ready for completion!")
+    
+    # 9. Test completion
+    print("\n9️⃣ Testing round completion...")
+    results = game_manager.complete_round(CHAT_ID)
+    assert results, "Failed to complete round"
+    print("✅ Round completed successfully!")
+    print("   Correct angle: {}°".format(results['angle']))
+    print("   Participants: {}/{}".format(
+        results['players_participated'], results['total_players']))
+    print("   Winners: {} players scored".format(len(results['scores'])))
+    assert results['players_participated'] == 2
+    winner = results['scores'][0][0]
+    print("   Winner: {} with guess {}°".format(
+        winner.first_name, winner.guess))
     
     print("\n🎉 Test completed!")
 
 if __name__ == "__main__":
-    main()
+    test_asyncio_monitoring()
@@ -3,6 +3,7 @@
 import asyncio
 from game_manager import game_manager
 from storage import storage
+from testutils import rewind_round
 
 async def test_button_disable():
     """Test that the angle image message ID is properly stored and retrieved."""
@@ -19,9 +20,7 @@ async def test_button_disable():
     
     # Create a round
     round_obj = game_manager.create_round(chat_id, 12345, 67890)
-    if not round_obj:
-        print("❌ Failed to create round")
-        return
+    assert round_obj, "Failed to create round"
     
     print(f"✅ Round created with angle: {round_obj.angle}°")
     print(f"Initial angle_image_message_id: {round_obj.angle_image_message_id}")
@@ -31,18 +30,14 @@ async def test_button_disable():
     # Simulate setting the angle image message ID (as the bot would do)
     test_message_id = 98765
     success = game_manager.set_angle_image_message_id(chat_id, test_message_id)
+    assert success, "Failed to set angle image message ID"
+    print(f"✅ Set angle image message ID to {test_message_id}")
     
-    if success:
-        print(f"✅ Set angle image message ID to {test_message_id}")
-        
-        # Verify it was stored
-        updated_round = game_manager.get_active_round(chat_id)
-        if updated_round and updated_round.angle_image_message_id == test_message_id:
-            print(f"✅ Angle image message ID correctly stored: {updated_round.angle_image_message_id}")
-        else:
-            print(f"❌ Angle image message ID not correctly stored")
-    else:
-        print("❌ Failed to set angle image message ID")
+    # Verify it was stored
+    updated_round = game_manager.get_active_round(chat_id)
+    assert updated_round and updated_round.angle_image_message_id == test_message_id, \
+        "Angle image message ID not correctly stored"
+    print(f"✅ Angle image message ID correctly stored: {updated_round.angle_image_message_id}")
     
     print("\nStep 3: Testing round completion...")
     
@@ -50,24 +45,21 @@ async def test_button_disable():
     game_manager.add_player(chat_id, 111, "player1", "Player1")
     game_manager.submit_guess(chat_id, 111, 180)
     
-    # Wait for minimum time and complete the round
+    # Rewind the round start past the minimum time and complete the round
     from config import config
-    print(f"Waiting {config.min_wait_time} seconds for min_wait_time...")
-    await asyncio.sleep(config.min_wait_time + 0.5)
+    print(f"Rewinding round start by {config.min_wait_time} seconds for min_wait_time...")
+    rewind_round(round_obj, config.min_wait_time + 0.5)
     
     # Complete the round
     results = game_manager.complete_round(chat_id)
-    if results:
-        print(f"✅ Round completed successfully!")
-        
-        # Verify the round is no longer active
-        final_round = game_manager.get_active_round(chat_id)
-        if final_round is None:
-            print("✅ Round properly cleaned up after completion")
-        else:
-            print(f"❌ Round still active after completion: status={final_round.status}")
-    else:
-        print("❌ Failed to complete round")
+    assert results, "Failed to complete round"
+    print(f"✅ Round completed successfully!")
+    
+    # Verify the round is no longer active and the disabled button can be found
+    assert results['angle_image_message_id'] == test_message_id
+    final_round = game_manager.get_active_round(chat_id)
+    assert final_round is None, f"Round still active after completion: status={final_round.status}"
+    print("✅ Round properly cleaned up after completion")
     
     # Clean up
     storage.clear_active_game(chat_id)
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test the TTL and size limits of the bot's cached chat lookups.
+"""
+
+import asyncio
+
+import bot as bot_module
+from testutils import make_test_bot
+
+# Test chat and user IDs
+CHAT_ID = -1001234567905  # Test group ID
+USER_IDS = [111111, 222222, 333333, 444444]
+
+async def test_admin_cache():
+    """Test admin status reuse inside the TTL, refetch after it, and LRU eviction."""
+    print("🔍 Testing the admin status cache...")
+    bot = make_test_bot()
+    fake = bot.app.bot
+    fake.member_status = 'administrator'
+    
+    # 1. A second check inside the TTL is answered from the cache
+    print("\n1️⃣ Checking the same user twice...")
+    assert await bot._is_user_admin(bot.app, CHAT_ID, USER_IDS[0])
+    assert await bot._is_user_admin(bot.app, CHAT_ID, USER_IDS[0])
+    assert fake.count('get_chat_member') == 1
+    print("✅ Cache hit inside the TTL")
+    
+    # 2. An answer older than the TTL is fetched again
+    print("\n2️⃣ Checking after the TTL...")
+    is_admin, checked_at = bot._admin_cache[(CHAT_ID, USER_IDS[0])]
+    bot._admin_cache[(CHAT_ID, USER_IDS[0])] = (is_admin, checked_at - bot_module.ADMIN_CACHE_TTL_SECONDS - 1)
+    fake.member_status = 'member'
+    assert not await bot._is_user_admin(bot.app, CHAT_ID, USER_IDS[0])
+    assert fake.count('get_chat_member') == 2
+    print("✅ Expired answer refetched")
+    
+    # 3. At the size cap the least recently used entry is evicted
+    print("\n3️⃣ Filling the cache past its cap...")
+    saved_cap = bot_module.ADMIN_CACHE_MAX_ENTRIES
+    bot_module.ADMIN_CACHE_MAX_ENTRIES = 3
+    try:
+        for user_id in USER_IDS[1:3]:
+            await bot._is_user_admin(bot.app, CHAT_ID, user_id)
+        await bot._is_user_admin(bot.app, CHAT_ID, USER_IDS[0])  # Touch the oldest entry
+        await bot._is_user_admin(bot.app, CHAT_ID, USER_IDS[3])
+        cached_users = [user_id for _, user_id in bot._admin_cache]
+        print(f"   Cached users: {cached_users}")
+        assert cached_users == [USER_IDS[2], USER_IDS[0], USER_IDS[3]]
+        assert fake.count('get_chat_member') == 5
+    finally:
+        bot_module.ADMIN_CACHE_MAX_ENTRIES = saved_cap
+    print("✅ Least recently used entry evicted")
+    
+    print("\n🎉 Test completed!")
+
+async def test_member_count_cache():
+    """Test member count reuse inside the TTL, refetch after it, and LRU eviction."""
+    print("🔍 Testing the member count cache...")
+    bot = make_test_bot()
+    fake = bot.app.bot
+    chat_ids = [CHAT_ID - i for i in range(4)]
+    
+    # 1. A second lookup inside the TTL is answered from the cache
+    print("\n1️⃣ Looking up the same chat twice...")
+    assert await bot._get_member_count(bot.app, chat_ids[0]) == 10
+    fake.member_count = 25
+    assert await bot._get_member_count(bot.app, chat_ids[0]) == 10
+    assert fake.count('get_chat_member_count') == 1
+    print("✅ Cache hit inside the TTL")
+    
+    # 2. A count older than the TTL is fetched again
+    print("\n2️⃣ Looking up after the TTL...")
+    count, fetched_at = bot._member_count_cache[chat_ids[0]]
+    bot._member_count_cache[chat_ids[0]] = (count, fetched_at - bot_module.MEMBER_COUNT_CACHE_TTL_SECONDS - 1)
+    assert await bot._get_member_count(bot.app, chat_ids[0]) == 25
+    assert fake.count('get_chat_member_count') == 2
+    print("✅ Expired count refetched")
+    
+    # 3. At the size cap the least recently used chat is evicted
+    print("\n3️⃣ Filling the cache past its cap...")
+    saved_cap = bot_module.MEMBER_COUNT_CACHE_MAX_ENTRIES
+    bot_module.MEMBER_COUNT_CACHE_MAX_ENTRIES = 3
+    try:
+        for chat_id in chat_ids[1:3]:
+            await bot._get_member_count(bot.app, chat_id)
+        await bot._get_member_count(bot.app, chat_ids[0])  # Touch the oldest entry
+        await bot._get_member_count(bot.app, chat_ids[3])
+        print(f"   Cached chats: {list(bot._member_count_cache)}")
+        assert list(bot._member_count_cache) == [chat_ids[2], chat_ids[0], chat_ids[3]]
+        assert fake.count('get_chat_member_count') == 5
+    finally:
+        bot_module.MEMBER_COUNT_CACHE_MAX_ENTRIES = saved_cap
+    print("✅ Least recently used chat evicted")
+    
+    print("\n🎉 Test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_admin_cache())
+    asyncio.run(test_member_count_cache())
@@ -1,10 +1,10 @@
 #!/usr/bin/env python3
 
 import asyncio
-import sys
 from game_manager import game_manager
 from storage import storage
 from config import config
+from testutils import rewind_round
 
 async def test_completion_logic():
     """Test the round completion logic to identify the bug."""
@@ -21,9 +21,7 @@ async def test_completion_logic():
     
     # Create a round
     round_obj = game_manager.create_round(chat_id, 12345, 67890)
-    if not round_obj:
-        print("❌ Failed to create round")
-        return
+    assert round_obj, "Failed to create round"
     
     print(f"✅ Round created with angle: {round_obj.angle}°")
     
@@ -34,6 +32,7 @@ async def test_completion_logic():
     print(f"  All submitted: {status['all_submitted']}")
     print(f"  Can complete: {status['can_complete']}")
     print(f"  Time elapsed: {status['time_elapsed']}")
+    assert status['active_players'] == 0 and not status['can_complete']
     
     print(f"\nStep 2: Adding a player...")
     
@@ -48,12 +47,14 @@ async def test_completion_logic():
     print(f"  Players pending: {status['players_pending']}")
     print(f"  All submitted: {status['all_submitted']}")
     print(f"  Can complete: {status['can_complete']}")
+    assert status['active_players'] == 1 and status['players_pending'] == 1
     
     print(f"\nStep 3: Player submitting guess...")
     
     # Submit a guess
     result = game_manager.submit_guess(chat_id, 111, 180)
     print(f"Guess submitted: {result}")
+    assert result
     
     # Get status after guess
     status = game_manager.get_round_status(chat_id)
@@ -66,41 +67,33 @@ async def test_completion_logic():
     print(f"  Can complete in: {status['can_complete_in']}")
     print(f"  Time elapsed: {status['time_elapsed']}")
     
-    if status['all_submitted']:
-        print("\n✅ All players have submitted!")
-        
-        print(f"\nStep 4: Testing completion logic...")
-        
-        # Wait a bit and check again
-        print(f"Waiting {config.min_wait_time} seconds for min_wait_time...")
-        await asyncio.sleep(config.min_wait_time + 1)
-        
-        status = game_manager.get_round_status(chat_id)
-        print(f"\nAfter waiting min_wait_time:")
-        print(f"  All submitted: {status['all_submitted']}")
-        print(f"  Can complete: {status['can_complete']}")
-        print(f"  Can complete in: {status['can_complete_in']}")
-        print(f"  Time elapsed: {status['time_elapsed']}")
-        
-        if status['can_complete']:
-            print("\n✅ Round should be ready to complete!")
-            
-            # Try to complete the round
-            results = game_manager.complete_round(chat_id)
-            if results:
-                print(f"\n✅ Round completed successfully!")
-                print(f"  Correct angle: {results['angle']}°")
-                print(f"  Players participated: {results['players_participated']}")
-                print(f"  Total players: {results['total_players']}")
-                if results['scores']:
-                    print(f"  Best score: {results['scores'][0][2]}° accuracy")
-            else:
-                print("\n❌ Round completion failed!")
-        else:
-            print(f"\n❌ Round not ready to complete after min_wait_time")
-            print(f"    This might be the bug!")
-    else:
-        print(f"\n❌ Not all players submitted, cannot test completion")
+    assert status['all_submitted'], "Not all players submitted, cannot test completion"
+    print("\n✅ All players have submitted!")
+    
+    print(f"\nStep 4: Testing completion logic...")
+    
+    # Rewind the round start past min_wait_time and check again
+    print(f"Rewinding round start by {config.min_wait_time} seconds for min_wait_time...")
+    rewind_round(round_obj, config.min_wait_time + 1)
+    
+    status = game_manager.get_round_status(chat_id)
+    print(f"\nAfter waiting min_wait_time:")
+    print(f"  All submitted: {status['all_submitted']}")
+    print(f"  Can complete: {status['can_complete']}")
+    print(f"  Can complete in: {status['can_complete_in']}")
+    print(f"  Time elapsed: {status['time_elapsed']}")
+    assert status['can_complete'], "Round not ready to complete after min_wait_time"
+    print("\n✅ Round should be ready to complete!")
+    
+    # Try to complete the round
+    results = game_manager.complete_round(chat_id)
+    assert results, "Round completion failed"
+    print(f"\n✅ Round completed successfully!")
+    print(f"  Correct angle: {results['angle']}°")
+    print(f"  Players participated: {results['players_participated']}")
+    print(f"  Total players: {results['total_players']}")
+    assert results['players_participated'] == 1
+    print(f"  Best score: {results['scores'][0][2]}° accuracy")
     
     # Clean up
     storage.clear_active_game(chat_id)
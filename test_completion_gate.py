@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Test that concurrent completion checks post a round's results exactly once.
+"""
+
+import asyncio
+
+from config import config
+from game_manager import game_manager
+from testutils import fake_command_update, make_test_bot, rewind_round
+
+# Test chat and user IDs
+CHAT_ID = -1001234567901  # Test group ID
+USER1_ID = 123456789
+USER2_ID = 987654321
+
+def ready_round(round_obj):
+    """Give a round a guess and rewind it so it can complete."""
+    assert game_manager.add_player(CHAT_ID, USER1_ID, "testuser1", "Test User 1")
+    assert game_manager.submit_guess(CHAT_ID, USER1_ID, 90)
+    rewind_round(round_obj, config.min_wait_time + 1)
+    assert game_manager.get_round_status(CHAT_ID)['can_complete']
+
+async def test_completion_gate():
+    """Test the _completing single-flight gate around round completion."""
+    print("🔍 Testing the completion gate...")
+    bot = make_test_bot()
+    fake = bot.app.bot
+    
+    # 1. Several concurrent checks complete the round and post results once
+    print("\n1️⃣ Running 5 concurrent completion checks...")
+    ready_round(game_manager.create_round(CHAT_ID, 100, USER1_ID))
+    completed = await asyncio.gather(*(bot._check_round_completion(CHAT_ID) for _ in range(5)))
+    print(f"   Results: {completed}")
+    assert completed.count(True) == 1, f"Expected exactly one completion, got {completed}"
+    assert fake.count('send_photo') == 1, "Results photo was not sent exactly once"
+    assert game_manager.get_active_round(CHAT_ID) is None
+    print("✅ Results sent exactly once")
+    
+    # 2. The completed chat stays gated
+    print("\n2️⃣ Checking again after completion...")
+    assert await bot._check_round_completion(CHAT_ID) is False
+    assert CHAT_ID in bot._completing
+    assert fake.count('send_photo') == 1
+    print("✅ Later checks return False without sending")
+    
+    # 3. /start_round re-opens the gate for the new round
+    print("\n3️⃣ Starting a new round...")
+    update = fake_command_update(CHAT_ID, USER2_ID, message_id=200)
+    await bot.start_round(update, bot.app)
+    round_obj = game_manager.get_active_round(CHAT_ID)
+    assert round_obj, f"New round not started: {update.replies}"
+    assert CHAT_ID not in bot._completing, "start_round did not re-open the gate"
+    
+    ready_round(round_obj)
+    assert await bot._check_round_completion(CHAT_ID) is True
+    assert fake.count('send_photo') == 3  # Question image of round 2, then its results
+    print("✅ The new round completes normally")
+    
+    await bot._stop_completion_monitoring(CHAT_ID)
+    print("\n🎉 Test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_completion_gate())
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Test that abandoned and finished-round number picker sessions are dropped.
+"""
+
+import asyncio
+import time
+
+from bot import GUESS_STATE_TTL_SECONDS, GuessState
+from testutils import make_test_bot
+
+# Test chat and user IDs
+CHAT_ID = -1001234567903  # Test group ID
+OTHER_CHAT_ID = -1001234567904  # Group whose round keeps running
+USER1_ID = 123456789
+USER2_ID = 987654321
+
+def add_state(bot, chat_id, user_id, message_id):
+    """Open a picker session as the Guess button would."""
+    state = GuessState(chat_id, user_id, f"user{user_id}", f"User {user_id}", temp_message_id=message_id)
+    bot.user_guess_states[(chat_id, user_id)] = state
+    return state
+
+async def test_guess_state_expiry():
+    """Test TTL expiry of picker sessions and their cleanup when a round ends."""
+    print("🔍 Testing picker session expiry...")
+    bot = make_test_bot()
+    fake = bot.app.bot
+    
+    # 1. Sessions untouched for longer than the TTL are swept, fresh ones survive
+    print("\n1️⃣ Sweeping with one stale and one fresh session...")
+    stale = add_state(bot, CHAT_ID, USER1_ID, 501)
+    stale.last_active = time.monotonic() - GUESS_STATE_TTL_SECONDS - 1
+    add_state(bot, CHAT_ID, USER2_ID, 502)
+    bot._sweep_guess_states()
+    await asyncio.sleep(0.01)  # Let the background deletes run
+    assert (CHAT_ID, USER1_ID) not in bot.user_guess_states, "Stale session was not swept"
+    assert (CHAT_ID, USER2_ID) in bot.user_guess_states, "Fresh session was swept"
+    assert [kwargs['message_id'] for name, kwargs in fake.calls if name == 'delete_message'] == [501]
+    print("✅ Stale session and its picker message removed")
+    
+    # 2. Ending a round drops that chat's sessions only
+    print("\n2️⃣ Stopping the round in one chat...")
+    add_state(bot, OTHER_CHAT_ID, USER1_ID, 601)
+    await bot._stop_completion_monitoring(CHAT_ID)
+    await asyncio.sleep(0.01)
+    assert list(bot.user_guess_states) == [(OTHER_CHAT_ID, USER1_ID)]
+    assert [kwargs['message_id'] for name, kwargs in fake.calls if name == 'delete_message'] == [501, 502]
+    print("✅ Finished round's sessions dropped, other chat untouched")
+    
+    print("\n🎉 Test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_guess_state_expiry())
@@ -3,9 +3,6 @@
 Test the improvements for preventing multiple guess messages and status message updates.
 """
 
-import sys
-sys.path.append('/home/grigolet/cernbox/personal/code/sandbox/gangle')
-
 from bot import GangleBot
 from config import config
 
@@ -27,14 +24,16 @@ def test_improvements():
         
         print(f"   ✅ status_message_ids attribute: {has_status_tracking}")
         print(f"   ✅ status_message_ids initialized empty: {status_dict_empty}")
+        assert has_status_tracking and status_dict_empty
         
         # Check existing attributes still work
         has_user_states = hasattr(bot, 'user_guess_states') 
-        has_completion_jobs = hasattr(bot, 'completion_monitor_jobs')
+        has_monitoring_tasks = hasattr(bot, 'monitoring_tasks')
         
         print(f"   ✅ user_guess_states attribute: {has_user_states}")
-        print(f"   ✅ completion_monitor_jobs attribute: {has_completion_jobs}")
-        
+        print(f"   ✅ monitoring_tasks attribute: {has_monitoring_tasks}")
+        assert has_user_states and has_monitoring_tasks
+    
     else:
         print("   ⚠️ Bot token not configured - skipping bot initialization tests")
     
@@ -56,8 +55,6 @@ def test_improvements():
     print("   • Single status message that updates in-place") 
     print("   • Cleaner chat experience with less message spam")
     print("   • Better resource management with proper cleanup")
-    
-    return True
 
 if __name__ == "__main__":
     test_improvements()
@@ -1,75 +1,67 @@
 #!/usr/bin/env python3
 """
-Test job queue functionality for the Gangle bot.
+Test that round monitoring no longer relies on periodic job queue jobs.
 """
 
-import sys
-sys.path.append('/home/grigolet/cernbox/personal/code/sandbox/gangle')
-
 from bot import GangleBot
 from config import config
 
 def test_job_queue():
-    """Test job queue functionality."""
+    """Test event-driven monitoring setup."""
     
-    print("🔧 Testing Job Queue Functionality")
+    print("🔧 Testing Event-Driven Monitoring")
     print("=" * 40)
     
     if not config.telegram_bot_token:
-        print("⚠️ Bot token not configured - cannot test job queue")
+        print("⚠️ Bot token not configured - cannot test monitoring")
         return
     
     # Initialize bot
     bot = GangleBot()
     
-    # Test 1: Check job queue is available
-    job_queue_available = bot.app.job_queue is not None
-    print(f"1️⃣ Job queue available: {'✅' if job_queue_available else '❌'} {job_queue_available}")
-    
-    # Test 2: Check callback methods exist
-    completion_callback_exists = hasattr(bot, '_monitor_round_completion_callback')
-    status_callback_exists = hasattr(bot, '_periodic_status_update_callback')
-    
-    print(f"2️⃣ Completion callback method: {'✅' if completion_callback_exists else '❌'} {completion_callback_exists}")
-    print(f"3️⃣ Status callback method: {'✅' if status_callback_exists else '❌'} {status_callback_exists}")
+    # Test 1: Check the periodic job queue callbacks are gone
+    leftover_callbacks = [
+        name for name in ('_monitor_round_completion_callback', '_periodic_status_update_callback')
+        if hasattr(bot, name)
+    ]
+    print(f"1️⃣ No periodic job callbacks: {'✅' if not leftover_callbacks else '❌'} {leftover_callbacks}")
+    assert not leftover_callbacks, f"Periodic job callbacks still present: {leftover_callbacks}"
     
-    # Test 3: Check core monitoring methods
+    # Test 2: Check core monitoring methods
     core_methods = [
         '_start_completion_monitoring',
-        '_monitor_round_completion', 
+        '_monitor_completion_loop',
+        '_wake_monitor',
         '_stop_completion_monitoring',
-        '_schedule_status_updates',
-        '_periodic_status_update'
+        '_schedule_status_update'
     ]
     
-    print("4️⃣ Core monitoring methods:")
+    print("2️⃣ Core monitoring methods:")
+    methods_exist = True
     for method in core_methods:
         exists = hasattr(bot, method)
+        methods_exist = methods_exist and exists
         print(f"   {method}: {'✅' if exists else '❌'} {exists}")
+    assert methods_exist, "Some monitoring methods are missing"
     
-    # Test 4: Check dictionaries are initialized
+    # Test 3: Check dictionaries are initialized
     tracking_dicts = [
-        ('completion_monitor_jobs', bot.completion_monitor_jobs),
-        ('status_update_jobs', bot.status_update_jobs), 
+        ('monitoring_tasks', bot.monitoring_tasks),
+        ('round_events', bot.round_events),
         ('status_message_ids', bot.status_message_ids),
         ('user_guess_states', bot.user_guess_states)
     ]
     
-    print("5️⃣ Tracking dictionaries initialized:")
+    print("3️⃣ Tracking dictionaries initialized:")
     for name, dict_obj in tracking_dicts:
         initialized = isinstance(dict_obj, dict) and len(dict_obj) == 0
         print(f"   {name}: {'✅' if initialized else '❌'} {initialized}")
+        assert initialized, f"{name} is not an empty dict"
     
     print("\n🎯 Summary:")
-    if job_queue_available and completion_callback_exists and status_callback_exists:
-        print("✅ All job queue components are properly set up!")
-        print("✅ The bot should now properly schedule and run periodic jobs")
-        print("✅ Status messages should update every 10 seconds")
-        print("✅ Round completion should be monitored every 10 seconds")
-    else:
-        print("❌ Some job queue components are missing")
-    
-    return True
+    print("✅ Round monitoring is event-driven!")
+    print("✅ Status messages update when guesses arrive, not on a timer")
+    print("✅ Rounds complete at their deadline or as soon as the last guess lands")
 
 if __name__ == "__main__":
     test_job_queue()
@@ -0,0 +1,58 @@
+#!/usr/bin/env python3
+"""
+Test that reveal images are re-sent by Telegram file_id and re-uploaded when it is rejected.
+"""
+
+import asyncio
+
+from telegram import InputFile
+from telegram.error import BadRequest
+
+from testutils import make_test_bot
+
+# Test chat ID and angle
+CHAT_ID = -1001234567906  # Test group ID
+ANGLE = 123
+
+def sent_photo(fake, index):
+    """The photo argument of the index-th send_photo call."""
+    return [kwargs['photo'] for name, kwargs in fake.calls if name == 'send_photo'][index]
+
+async def test_photo_file_ids():
+    """Test file_id reuse for reveal images and the re-upload fallback."""
+    print("🔍 Testing reveal image file_id reuse...")
+    bot = make_test_bot()
+    fake = bot.app.bot
+    
+    # 1. The first reveal is uploaded and its file_id remembered
+    print("\n1️⃣ Sending the first reveal...")
+    await bot._send_angle_photo(CHAT_ID, ANGLE, show_label=True)
+    assert isinstance(sent_photo(fake, 0), InputFile)
+    first_id = bot._photo_file_ids[ANGLE]
+    print(f"✅ Uploaded, cached file_id {first_id}")
+    
+    # 2. The next reveal of the same angle is sent by file_id
+    print("\n2️⃣ Sending the same reveal again...")
+    await bot._send_angle_photo(CHAT_ID, ANGLE, show_label=True)
+    assert sent_photo(fake, 1) == first_id
+    print("✅ Re-sent by file_id")
+    
+    # 3. A rejected file_id falls back to a fresh upload and replaces the cached id
+    print("\n3️⃣ Rejecting the cached file_id...")
+    fake.errors['send_photo'] = BadRequest("Wrong file identifier/http url specified")
+    await bot._send_angle_photo(CHAT_ID, ANGLE, show_label=True)
+    assert sent_photo(fake, 2) == first_id
+    assert isinstance(sent_photo(fake, 3), InputFile)
+    assert bot._photo_file_ids[ANGLE] not in (None, first_id)
+    print(f"✅ Re-uploaded, cached file_id now {bot._photo_file_ids[ANGLE]}")
+    
+    # 4. Question images are never sent by file_id
+    print("\n4️⃣ Sending a question image of the same angle...")
+    await bot._send_angle_photo(CHAT_ID, ANGLE, show_label=False)
+    assert isinstance(sent_photo(fake, 4), InputFile)
+    print("✅ Question image uploaded fresh")
+    
+    print("\n🎉 Test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_photo_file_ids())
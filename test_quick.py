@@ -5,6 +5,7 @@ import os
 from game_manager import game_manager
 from storage import storage
 from config import config
+from testutils import rewind_round
 
 async def test_quick_completion():
     """Test completion with a very short min_wait_time."""
@@ -30,9 +31,7 @@ async def test_quick_completion():
         
         # Create a round
         round_obj = game_manager.create_round(chat_id, 12345, 67890)
-        if not round_obj:
-            print("❌ Failed to create round")
-            return
+        assert round_obj, "Failed to create round"
         
         print(f"✅ Round created with angle: {round_obj.angle}°")
         
@@ -44,50 +43,39 @@ async def test_quick_completion():
         
         # Check status immediately after guess
         status = game_manager.get_round_status(chat_id)
-        if not status:
-            print("❌ Failed to get round status")
-            return
-            
+        assert status, "Failed to get round status"
+        
         print("\nAfter guess submitted:")
         print(f"  Active players: {status['active_players']}")
         print(f"  All submitted: {status['all_submitted']}")
         print(f"  Can complete: {status['can_complete']}")
         print(f"  Can complete in: {status['can_complete_in']} seconds")
+        assert status['all_submitted'] and not status['can_complete'], \
+            f"Unexpected status: all_submitted={status['all_submitted']}, can_complete={status['can_complete']}"
+        
+        print(f"\nStep 3: Rewinding round start by {config.min_wait_time} seconds for min_wait_time...")
+        rewind_round(round_obj, config.min_wait_time + 0.5)  # A bit extra to be sure
+        
+        # Check status again
+        status = game_manager.get_round_status(chat_id)
+        assert status, "Failed to get round status after waiting"
+        
+        print("\nAfter waiting:")
+        print(f"  All submitted: {status['all_submitted']}")
+        print(f"  Can complete: {status['can_complete']}")
+        print(f"  Time elapsed: {status['time_elapsed']} seconds")
+        assert status['can_complete'], "Round STILL not ready to complete"
+        print("\n✅ Round should be ready to complete!")
         
-        if status['all_submitted'] and not status['can_complete']:
-            print(f"\nStep 3: Waiting {config.min_wait_time} seconds for min_wait_time...")
-            await asyncio.sleep(config.min_wait_time + 0.5)  # Wait a bit extra to be sure
-            
-            # Check status again
-            status = game_manager.get_round_status(chat_id)
-            if not status:
-                print("❌ Failed to get round status after waiting")
-                return
-                
-            print("\nAfter waiting:")
-            print(f"  All submitted: {status['all_submitted']}")
-            print(f"  Can complete: {status['can_complete']}")
-            print(f"  Time elapsed: {status['time_elapsed']} seconds")
-            
-            if status['can_complete']:
-                print("\n✅ Round should be ready to complete!")
-                
-                # Try to complete the round
-                results = game_manager.complete_round(chat_id)
-                if results:
-                    print(f"\n🎉 Round completed successfully!")
-                    print(f"  Correct angle: {results['angle']}°")
-                    print(f"  Players participated: {results['players_participated']}")
-                    print(f"  Total players: {results['total_players']}")
-                    if results['scores']:
-                        print(f"  Best score: {results['scores'][0][2]}° accuracy")
-                else:
-                    print("\n❌ Round completion failed!")
-            else:
-                print(f"\n❌ Round STILL not ready to complete!")
-                print(f"    This indicates the bug is not fixed")
-        else:
-            print(f"\n❌ Unexpected status: all_submitted={status['all_submitted']}, can_complete={status['can_complete']}")
+        # Try to complete the round
+        results = game_manager.complete_round(chat_id)
+        assert results, "Round completion failed"
+        print(f"\n🎉 Round completed successfully!")
+        print(f"  Correct angle: {results['angle']}°")
+        print(f"  Players participated: {results['players_participated']}")
+        print(f"  Total players: {results['total_players']}")
+        assert results['players_participated'] == 1
+        print(f"  Best score: {results['scores'][0][2]}° accuracy")
         
         # Clean up
         storage.clear_active_game(chat_id)
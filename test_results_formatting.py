@@ -3,10 +3,8 @@
 Test the results formatting to ensure no Markdown parsing errors
 """
 
-import sys
-sys.path.append('/home/grigolet/cernbox/personal/code/sandbox/gangle')
-
-from bot import escape_markdown
+from bot import format_round_results
+from game_manager import Player
 
 def test_results_formatting():
     """Test results text formatting with various user names."""
@@ -21,24 +19,20 @@ def test_results_formatting():
     ]
     
     # Create results text like in the bot
-    results_text = "🎉 *Round Complete\\!*\n\n"
-    results_text += f"🎯 *Correct Angle:* 123°\n\n"
-    results_text += "🏆 *Results:*\n"
-    
-    for i, player in enumerate(test_players, 1):
-        emoji = "🥇" if i == 1 else "🥈" if i == 2 else "🥉" if i == 3 else f"{i}\\."
-        # Show username with @ prefix, fallback to first_name if no username
-        raw_display_name = f"@{player['username']}" if player['username'] else player['first_name']
-        display_name = escape_markdown(raw_display_name)
-        results_text += f"{emoji} {display_name}: {player['guess']}° \\({player['points']} pts, ±{player['accuracy']}°\\)\n"
+    scores = [
+        (Player(user_id=i, username=p['username'], first_name=p['first_name'], guess=p['guess']), p['points'], p['accuracy'])
+        for i, p in enumerate(test_players, 1)
+    ]
+    results = {'angle': 123, 'scores': scores, 'total_players': 8, 'players_participated': 5}
+    results_text = format_round_results(results)
     
-    results_text += f"\n\n👥 *Participation:* 5/8 players"
+    assert "\\(with\\)" in results_text
+    assert "@user\\*with\\*stars" in results_text
+    assert "👥 *Participation:* 5/8 players" in results_text
     
     print("📝 Generated results text:")
     print(results_text)
     print("\n✅ Results formatting test completed successfully!")
-    
-    return results_text
 
 if __name__ == "__main__":
     test_results_formatting()
@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Test that round status updates are debounced and skipped when nothing visible changed.
+"""
+
+import asyncio
+
+from config import config
+from game_manager import game_manager
+from testutils import make_test_bot
+
+# Test chat and user IDs
+CHAT_ID = -1001234567902  # Test group ID
+USER_IDS = [111111, 222222, 333333, 444444, 555555]
+
+async def test_status_updates():
+    """Test status debouncing, fingerprint skipping and retry after a failed post."""
+    print("🔍 Testing round status updates...")
+    bot = make_test_bot()
+    fake = bot.app.bot
+    
+    saved_debounce = config.status_debounce_seconds
+    config.status_debounce_seconds = 0.05
+    try:
+        game_manager.create_round(CHAT_ID, 100, USER_IDS[0])
+        for user_id in USER_IDS:
+            assert game_manager.add_player(CHAT_ID, user_id, f"user{user_id}", f"User {user_id}")
+        
+        # 1. The first status is posted as a new message
+        print("\n1️⃣ Posting the first status...")
+        await bot._update_round_status(CHAT_ID)
+        assert fake.count('send_message') == 1
+        assert CHAT_ID in bot.status_message_ids
+        print("✅ Status message posted")
+        
+        # 2. Three guesses inside one debounce window produce a single edit
+        print("\n2️⃣ Submitting 3 guesses inside one debounce window...")
+        for user_id in USER_IDS[:3]:
+            assert game_manager.submit_guess(CHAT_ID, user_id, 90)
+            await bot._after_guess_submitted(CHAT_ID)
+        assert fake.count('edit_message_text') == 0, "Edit sent before the debounce window ended"
+        await asyncio.sleep(config.status_debounce_seconds + 0.1)
+        print(f"   Edits issued: {fake.count('edit_message_text')}")
+        assert fake.count('edit_message_text') == 1
+        assert "Submitted:* 3" in fake.calls[-1][1]['text']
+        print("✅ Guesses coalesced into one edit")
+        
+        # 3. An unchanged fingerprint skips the edit
+        print("\n3️⃣ Refreshing an unchanged status...")
+        await bot._update_round_status(CHAT_ID)
+        assert fake.count('edit_message_text') == 1, "Unchanged status was edited again"
+        print("✅ Unchanged status skipped")
+        
+        # 4. A failed post leaves the fingerprint unset, so the next update retries
+        print("\n4️⃣ Failing the next post...")
+        posted_fingerprint = bot._last_status_fingerprint[CHAT_ID]
+        assert game_manager.submit_guess(CHAT_ID, USER_IDS[3], 90)
+        fake.errors['edit_message_text'] = RuntimeError("edit failed")
+        fake.errors['send_message'] = RuntimeError("send failed")
+        await bot._update_round_status(CHAT_ID)
+        assert bot._last_status_fingerprint[CHAT_ID] == posted_fingerprint, "Fingerprint stored for a failed post"
+        
+        sends = fake.count('send_message')
+        await bot._update_round_status(CHAT_ID)
+        assert fake.count('send_message') == sends + 1, "Failed status was not retried"
+        assert bot._last_status_fingerprint[CHAT_ID] != posted_fingerprint
+        print("✅ Failed post retried on the next update")
+    finally:
+        config.status_debounce_seconds = saved_debounce
+        await bot._stop_completion_monitoring(CHAT_ID)
+    
+    print("\n🎉 Test completed!")
+
+if __name__ == "__main__":
+    asyncio.run(test_status_updates())
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test the SQLite storage layer against a temporary data directory.
+"""
+
+import json
+import tempfile
+from pathlib import Path
+
+from config import config
+from storage import StorageManager
+
+# Test chat and user IDs
+CHAT_ID = -1001234567899  # Test group ID
+LEGACY_CHAT_ID = -1001234567898  # Group imported from the old JSON files
+USER1_ID = 123456789
+USER2_ID = 987654321
+USER3_ID = 555555555
+
+def test_storage():
+    """Test leaderboard upserts, ranking, resets and the legacy JSON import."""
+    print("🔍 Testing SQLite storage...")
+    
+    saved_dirs = (config.data_dir, config.leaderboards_dir, config.games_dir, config._dirs_created)
+    with tempfile.TemporaryDirectory(prefix='gangle-storage-') as tmp:
+        config.data_dir = Path(tmp)
+        config.leaderboards_dir = config.data_dir / 'leaderboards'
+        config.games_dir = config.data_dir / 'games'
+        config._dirs_created = False
+        try:
+            # 1. Legacy JSON files are imported when the database is created
+            print("\n1️⃣ Importing legacy JSON files...")
+            config.leaderboards_dir.mkdir(parents=True)
+            config.games_dir.mkdir(parents=True)
+            legacy_stats = {
+                'username': 'legacy', 'first_name': 'Legacy', 'total_points': 42,
+                'rounds_played': 3, 'best_guess': 7, 'last_played': '2024-01-01T00:00:00'
+            }
+            (config.leaderboards_dir / f"group_{LEGACY_CHAT_ID}.json").write_text(
+                json.dumps({str(USER1_ID): legacy_stats}), encoding='utf-8')
+            (config.games_dir / f"game_{LEGACY_CHAT_ID}.json").write_text(json.dumps({
+                'angle': 77, 'message_id': 100, 'start_time': '2024-01-01T00:00:00',
+                'players': {str(USER1_ID): {'username': 'legacy'}},
+                'guesses': {str(USER1_ID): 80},
+                'forfeited': [], 'status': 'waiting_for_guesses'
+            }), encoding='utf-8')
+            
+            storage = StorageManager()
+            imported = storage.load_top_players(LEGACY_CHAT_ID, 10)
+            assert len(imported) == 1, f"Expected 1 imported player, got {imported}"
+            assert imported[0]['user_id'] == USER1_ID
+            assert imported[0]['total_points'] == 42 and imported[0]['best_guess'] == 7
+            game = storage.load_active_game(LEGACY_CHAT_ID)
+            assert game and game['angle'] == 77, f"Game not imported: {game}"
+            assert game['players'] == {USER1_ID: {'username': 'legacy'}}
+            assert game['guesses'] == {USER1_ID: 80}
+            print("✅ Leaderboard and active game imported with integer user IDs")
+            
+            # 2. Repeated stats updates add up, keeping the closest guess
+            print("\n2️⃣ Updating the same player three times...")
+            assert storage.update_player_stats(CHAT_ID, USER1_ID, "user1", "User 1", 80, 20)
+            assert storage.update_player_stats(CHAT_ID, USER1_ID, "user1_renamed", "User 1", 90, 10)
+            assert storage.update_player_stats(CHAT_ID, USER1_ID, "user1_renamed", "User 1", 50, 50)
+            row = storage.load_top_players(CHAT_ID, 10)[0]
+            print(f"   Row: {row}")
+            assert row['total_points'] == 220
+            assert row['rounds_played'] == 3
+            assert row['best_guess'] == 10, "best_guess should keep the minimum"
+            assert row['username'] == "user1_renamed"
+            print("✅ Upsert sums points and rounds, best_guess keeps the minimum")
+            
+            # 3. Ranking orders by points, breaks ties on best guess, and honours the limit
+            print("\n3️⃣ Checking leaderboard ordering...")
+            assert storage.update_player_stats(CHAT_ID, USER2_ID, "user2", "User 2", 220, 5)
+            assert storage.update_player_stats(CHAT_ID, USER3_ID, "user3", "User 3", 300, 40)
+            ranking = [p['user_id'] for p in storage.load_top_players(CHAT_ID, 10)]
+            print(f"   Ranking: {ranking}")
+            assert ranking == [USER3_ID, USER2_ID, USER1_ID]
+            assert [p['user_id'] for p in storage.load_top_players(CHAT_ID, 2)] == [USER3_ID, USER2_ID]
+            print("✅ Points descending, ties closest-guess first, LIMIT applied")
+            
+            # 4. Reset moves the standings into the backup table
+            print("\n4️⃣ Resetting the leaderboard...")
+            assert storage.reset_leaderboard(CHAT_ID)
+            assert storage.load_top_players(CHAT_ID, 10) == []
+            backup = storage._db.execute(
+                "SELECT user_id, total_points FROM leaderboard_backup WHERE group_id = ? ORDER BY user_id",
+                (CHAT_ID,)
+            ).fetchall()
+            assert [tuple(r) for r in backup] == sorted([(USER1_ID, 220), (USER2_ID, 220), (USER3_ID, 300)])
+            assert len(storage.load_top_players(LEGACY_CHAT_ID, 10)) == 1, "Reset touched another group"
+            print("✅ Rows copied to leaderboard_backup, other groups untouched")
+            
+            storage._db.close()
+        finally:
+            config.data_dir, config.leaderboards_dir, config.games_dir, config._dirs_created = saved_dirs
+    
+    print("\n🎉 Test completed!")
+
+if __name__ == "__main__":
+    test_storage()
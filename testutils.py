@@ -0,0 +1,103 @@
+"""
+Helpers shared by the test_*.py scripts.
+"""
+import asyncio
+import datetime
+from types import SimpleNamespace
+
+from bot import GangleBot
+from game_manager import GameRound
+
+
+def rewind_round(round_obj: GameRound, seconds: float):
+    """Move a round's start back in time, as if it had been running `seconds` longer.
+    
+    Both clocks are rewound: start_time for the stored timestamp and
+    start_monotonic, which the round timing checks read.
+    """
+    round_obj.start_time -= datetime.timedelta(seconds=seconds)
+    round_obj.start_monotonic -= seconds
+
+
+class FakeBot:
+    """Stand-in for telegram.Bot that records Bot API calls instead of making them.
+    
+    Each call is appended to `calls` as (method, kwargs). An exception stored in
+    `errors[method]` is raised by the next call to that method, once.
+    """
+    
+    def __init__(self, member_status: str = 'member', member_count: int = 10):
+        self.calls = []
+        self.errors = {}
+        self.member_status = member_status
+        self.member_count = member_count
+        self._next_message_id = 1000
+    
+    async def _record(self, method: str, **kwargs):
+        self.calls.append((method, kwargs))
+        await asyncio.sleep(0)  # Yield like a real request, so concurrent callers interleave
+        error = self.errors.pop(method, None)
+        if error:
+            raise error
+        self._next_message_id += 1
+        return SimpleNamespace(message_id=self._next_message_id, photo=[])
+    
+    def count(self, method: str) -> int:
+        """Number of recorded calls to a Bot API method."""
+        return sum(1 for name, _ in self.calls if name == method)
+    
+    async def send_message(self, **kwargs):
+        return await self._record('send_message', **kwargs)
+    
+    async def send_photo(self, **kwargs):
+        message = await self._record('send_photo', **kwargs)
+        message.photo = [SimpleNamespace(file_id=f"file-{message.message_id}")]
+        return message
+    
+    async def edit_message_text(self, **kwargs):
+        return await self._record('edit_message_text', **kwargs)
+    
+    async def edit_message_reply_markup(self, **kwargs):
+        return await self._record('edit_message_reply_markup', **kwargs)
+    
+    async def delete_message(self, **kwargs):
+        return await self._record('delete_message', **kwargs)
+    
+    async def get_chat_member(self, chat_id, user_id):
+        await self._record('get_chat_member', chat_id=chat_id, user_id=user_id)
+        return SimpleNamespace(status=self.member_status)
+    
+    async def get_chat_member_count(self, chat_id):
+        await self._record('get_chat_member_count', chat_id=chat_id)
+        return self.member_count
+
+
+def make_test_bot() -> GangleBot:
+    """A GangleBot wired to a FakeBot, with image rendering replaced by fixed bytes.
+    
+    The FakeBot is reachable as `bot.app.bot`; pass `bot.app` as the handler context.
+    """
+    bot = GangleBot()
+    bot.app = SimpleNamespace(bot=FakeBot())
+    
+    async def render(angle: int, show_label: bool = False) -> bytes:
+        return b'png'
+    
+    bot._render = render
+    return bot
+
+
+def fake_command_update(chat_id: int, user_id: int, message_id: int = 1):
+    """A minimal Update for a group command; replies are collected in `update.replies`."""
+    replies = []
+    
+    async def reply_text(text, **kwargs):
+        replies.append(text)
+    
+    message = SimpleNamespace(
+        chat=SimpleNamespace(id=chat_id, type='supergroup'),
+        from_user=SimpleNamespace(id=user_id),
+        message_id=message_id,
+        reply_text=reply_text
+    )
+    return SimpleNamespace(message=message, effective_user=message.from_user, replies=replies)